@@ -0,0 +1,37 @@
+"""
+assets.py
+
+Images are decoded once per process and the Surfaces shared by every Game
+built after that, so a restart, a server lobby or a vector of training envs
+never re-reads the PNGs. Callers must treat the returned Surfaces as
+read-only.
+
+    img = load_image("assets/enemies/drone.png", max_dim=30)
+"""
+import os
+
+import pygame
+
+images = {}     # (path, max_dim) -> pygame.Surface
+missing = set() # optional paths already reported as not found
+
+def load_image(path, max_dim=None, optional=False):
+    """
+    Load `path`, scaled so its longer side is `max_dim` when given. With
+    `optional`, a missing file gives None and is reported once per process.
+    """
+    key = (path, max_dim)
+    img = images.get(key)
+    if img is None:
+        if optional and not os.path.exists(path):
+            if path not in missing:
+                missing.add(path)
+                print("Warning: image not found at", path)
+            return None
+        img = pygame.image.load(path)
+        if max_dim is not None:
+            iw, ih = img.get_size()
+            scale = max_dim / max(iw, ih)
+            img = pygame.transform.scale(img, (int(iw * scale), int(ih * scale)))
+        images[key] = img
+    return img
@@ -0,0 +1,190 @@
+"""
+capture.py
+
+Renders a game to disk with no window, as fast as the CPU allows, for
+replay clips and regression videos.
+
+    python capture.py --out captures/run1 --seconds 60 --fps 30
+    python capture.py --out captures/run1 --format raw --build 2:point,0:splash
+    ffmpeg -f rawvideo -pix_fmt rgb24 -s 800x600 -r 30 -i captures/run1/capture.rgb run1.mp4
+
+The simulation advances at a fixed timestep per frame. Game.draw renders
+into pygame Surfaces that are views over slots in one shared-memory block,
+so a finished frame is never copied on its way to the encoders. Slot
+numbers go out through a bounded queue to a pool of worker processes.
+Each worker writes its frame to disk and hands the slot back. When every
+slot is busy, rendering waits for the encoders instead of buffering
+without limit.
+
+  png   one frame_NNNNNN.png per frame
+  raw   a single rgb24 file; each worker writes its frame at offset
+        index * frame size, so frames can finish in any order
+"""
+import argparse
+import multiprocessing as mp
+import os
+import queue
+import time
+from multiprocessing import shared_memory
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+import commands
+
+RAW_NAME = "capture.rgb"
+POLL_SECONDS = 0.5  # how often a blocked acquire() checks the encoders are still alive
+
+def encode_worker(shm_name, width, height, fmt, out_dir, jobs, free_slots):
+    frame_bytes = width * height * 3
+    shm = shared_memory.SharedMemory(name=shm_name)
+    fd = os.open(os.path.join(out_dir, RAW_NAME), os.O_WRONLY) if fmt == "raw" else None
+    pixels = surface = None
+    try:
+        while True:
+            job = jobs.get()
+            if job is None:
+                break
+            index, slot = job
+            pixels = shm.buf[slot * frame_bytes:(slot + 1) * frame_bytes]
+            if fmt == "png":
+                surface = pygame.image.frombuffer(pixels, (width, height), "RGB")
+                pygame.image.save(surface, os.path.join(out_dir, f"frame_{index:06d}.png"))
+                del surface
+            else:
+                os.pwrite(fd, pixels, index * frame_bytes)
+            pixels.release()
+            free_slots.put(slot)
+    finally:
+        # A failed write leaves the frame's views open, and shm.close() would
+        # raise over the real error while they are
+        surface = None
+        if pixels is not None:
+            pixels.release()
+        if fd is not None:
+            os.close(fd)
+        shm.close()
+
+class FrameCapture:
+    """
+    Shared frame slots plus the encoder pool.
+
+        capture = FrameCapture(800, 600, "out")
+        slot = capture.acquire()          # blocks while every slot is being encoded
+        game.draw(capture.surfaces[slot])
+        capture.submit(frame_index, slot)
+        ...
+        capture.close()                   # waits for the encoders to finish
+    """
+    def __init__(self, width, height, out_dir, fmt="png", workers=None, slots=None):
+        if fmt not in ("png", "raw"):
+            raise ValueError(f"unknown capture format '{fmt}'")
+        workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        slots = slots or 2 * workers
+        self.width = width
+        self.height = height
+        self.frame_bytes = width * height * 3
+        os.makedirs(out_dir, exist_ok=True)
+        if fmt == "raw":
+            open(os.path.join(out_dir, RAW_NAME), "wb").close()
+
+        self.shm = shared_memory.SharedMemory(create=True, size=slots * self.frame_bytes)
+        self.views = [self.shm.buf[i * self.frame_bytes:(i + 1) * self.frame_bytes] for i in range(slots)]
+        self.surfaces = [pygame.image.frombuffer(view, (width, height), "RGB") for view in self.views]
+
+        ctx = mp.get_context("spawn")
+        self.jobs = ctx.Queue(maxsize=slots)
+        self.free_slots = ctx.Queue()
+        for slot in range(slots):
+            self.free_slots.put(slot)
+        self.workers = [
+            ctx.Process(target=encode_worker, name=f"encoder-{i}", daemon=True,
+                        args=(self.shm.name, width, height, fmt, out_dir, self.jobs, self.free_slots))
+            for i in range(workers)
+        ]
+        for worker in self.workers:
+            worker.start()
+
+    def acquire(self):
+        """A free slot; raises if an encoder died, since its slot would never come back."""
+        while True:
+            try:
+                return self.free_slots.get(timeout=POLL_SECONDS)
+            except queue.Empty:
+                for worker in self.workers:
+                    if not worker.is_alive():
+                        raise RuntimeError(f"{worker.name} exited with code {worker.exitcode}")
+
+    def submit(self, index, slot):
+        self.jobs.put((index, slot))
+
+    def close(self):
+        # Only live encoders can take a stop marker; the dead ones would leave the queue full
+        for worker in self.workers:
+            if worker.is_alive():
+                self.jobs.put(None)
+        for worker in self.workers:
+            worker.join()
+        # Surfaces and views hold the mapping open
+        self.surfaces = None
+        for view in self.views:
+            view.release()
+        self.views = None
+        self.shm.close()
+        self.shm.unlink()
+
+def run_capture(game, capture, frames, fps=30, sim_dt=1/60):
+    """Step `game` on a fixed timestep and capture `frames` frames. Returns the wall time taken."""
+    substeps = max(1, round(1.0 / (fps * sim_dt)))
+    dt = 1.0 / (fps * substeps)
+    start = time.perf_counter()
+    for index in range(frames):
+        for _ in range(substeps):
+            game.update(dt)
+        slot = capture.acquire()
+        surface = capture.surfaces[slot]
+        surface.fill((0, 0, 0))
+        game.draw(surface)
+        capture.submit(index, slot)
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="Render a game offscreen to PNG frames or raw video")
+    parser.add_argument("--out", required=True, help="output directory")
+    parser.add_argument("--format", choices=("png", "raw"), default="png")
+    parser.add_argument("--seconds", type=float, default=30.0, help="game time to capture")
+    parser.add_argument("--fps", type=int, default=30)
+    parser.add_argument("--workers", type=int, default=None, help="encoder processes (default: cores - 1)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--build", default="",
+                        help="towers to buy before starting, e.g. 2:point,0:splash (spot:type)")
+    args = parser.parse_args()
+
+    from game import Game
+
+    width, height = 800, 600
+    game = Game(width, height, seed=args.seed)
+    reg = game.tower_manager.registry
+    for item in filter(None, args.build.split(",")):
+        spot, _, tower_type = item.partition(":")
+        type_id = reg.type_id(tower_type)
+        if not spot.isdigit() or int(spot) >= len(game.tower_spots) or type_id is None:
+            parser.error(f"bad --build entry '{item}' (expected spot:type, spots: 0-{len(game.tower_spots) - 1}, "
+                         f"types: {', '.join(reg.type_names)})")
+        commands.apply_command(game, commands.PLACE, int(spot), type_id)
+    game.toggle_pause()  # first start -> running
+
+    frames = int(args.seconds * args.fps)
+    capture = FrameCapture(width, height, args.out, args.format, args.workers)
+    try:
+        render_time = run_capture(game, capture, frames, args.fps)
+    finally:
+        capture.close()
+    print(f"Captured {frames} frames ({args.seconds:g}s of game time) to {args.out} "
+          f"in {render_time:.1f}s, {frames / max(render_time, 1e-9):.0f} frames/s")
+    if args.format == "raw":
+        print(f"  ffmpeg -f rawvideo -pix_fmt rgb24 -s {width}x{height} -r {args.fps} "
+              f"-i {os.path.join(args.out, RAW_NAME)} out.mp4")
+
+if __name__ == "__main__":
+    main()
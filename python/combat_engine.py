@@ -0,0 +1,234 @@
+import heapq
+
+import numpy as np
+
+KEY_SHIFT = 32  # enemy key = owner << KEY_SHIFT | enemy id
+
+class CombatEngine:
+    """
+    Shared melee simulation for every fighter on the field (barracks soldiers
+    and heroes alike).
+
+    Fighters live in parallel NumPy arrays indexed by a slot number rather than
+    one object each, and `step()` resolves respawns, movement to rally points,
+    engagement, blocking and the damage exchange with enemies as a handful of
+    whole-array operations per tick.
+
+    One engine can serve several games at once (VectorTowerDefenseEnv does
+    this): each game joins under an owner index, every fighter slot records
+    its owner, and fighters only ever see enemies of their own game. `step()`
+    then takes one delta per owner, and an owner whose delta is 0 sits the
+    tick out.
+    """
+    FLOAT_FIELDS = (
+        "x", "y", "rally_x", "rally_y",
+        "hp", "max_hp", "damage", "attack_interval", "cooldown",
+        "engage_range", "speed", "respawn_timer", "respawn_time",
+    )
+
+    def __init__(self, capacity=32):
+        self.games = []           # owner index -> Game
+        self.blocked_ids = []     # owner index -> enemy ids held in place by a blocking fighter
+        self.count = 0            # high-water mark of used slots
+        self.capacity = 0
+        self.free_slots = []      # heap, so a re-joining game gets its old slot numbers back
+        for name in self.FLOAT_FIELDS:
+            setattr(self, name, np.zeros(0))
+        self.dead = np.zeros(0, dtype=bool)
+        self.blocks = np.zeros(0, dtype=bool)
+        self.used = np.zeros(0, dtype=bool)
+        self.owner = np.zeros(0, dtype=np.int64)
+        self.target = np.zeros(0, dtype=np.int64)  # enemy key, -1 when free
+        self.grow(capacity)
+
+    def grow(self, capacity):
+        extra = capacity - self.capacity
+        for name in self.FLOAT_FIELDS:
+            setattr(self, name, np.concatenate([getattr(self, name), np.zeros(extra)]))
+        self.dead = np.concatenate([self.dead, np.zeros(extra, dtype=bool)])
+        self.blocks = np.concatenate([self.blocks, np.zeros(extra, dtype=bool)])
+        self.used = np.concatenate([self.used, np.zeros(extra, dtype=bool)])
+        self.owner = np.concatenate([self.owner, np.zeros(extra, dtype=np.int64)])
+        self.target = np.concatenate([self.target, np.full(extra, -1, dtype=np.int64)])
+        self.capacity = capacity
+
+    def add_game(self, game, owner=0):
+        """Seat `game` as `owner`, freeing whatever fighters the previous game there left behind."""
+        while len(self.games) <= owner:
+            self.games.append(None)
+            self.blocked_ids.append(set())
+        self.games[owner] = game
+        self.blocked_ids[owner] = set()
+        for slot in np.nonzero(self.used[:self.count] & (self.owner[:self.count] == owner))[0].tolist():
+            self.used[slot] = False
+            heapq.heappush(self.free_slots, slot)
+        # Give back trailing free slots, so readers of [:count] never see stale fighters
+        while self.count and not self.used[self.count - 1]:
+            self.count -= 1
+        self.free_slots = [slot for slot in self.free_slots if slot < self.count]
+        heapq.heapify(self.free_slots)
+
+    def add_fighter(self, config, owner=0):
+        """Allocate a fighter slot from a JS-style config dict and return its index."""
+        if self.free_slots:
+            i = heapq.heappop(self.free_slots)
+        else:
+            if self.count == self.capacity:
+                self.grow(self.capacity * 2)
+            i = self.count
+            self.count += 1
+        self.used[i] = True
+        self.owner[i] = owner
+
+        x = config.get("x", 0)
+        y = config.get("y", 0)
+        self.x[i] = x
+        self.y[i] = y
+        self.rally_x[i] = config.get("rallyX", x)
+        self.rally_y[i] = config.get("rallyY", y)
+        self.max_hp[i] = config.get("maxHp", 50)
+        self.hp[i] = self.max_hp[i]
+        self.damage[i] = config.get("damage", 5)
+        self.attack_interval[i] = config.get("attackInterval", 1.0)
+        self.cooldown[i] = 0.0
+        self.engage_range[i] = config.get("engagementRange", 10)
+        self.speed[i] = config.get("speed", 60)
+        self.respawn_time[i] = config.get("respawnTime", 10)
+        self.respawn_timer[i] = 0.0
+        self.dead[i] = False
+        self.blocks[i] = config.get("blocks", True)
+        self.target[i] = -1
+        return i
+
+    def set_rally(self, slots, rx, ry):
+        self.rally_x[slots] = rx
+        self.rally_y[slots] = ry
+
+    def set_stats(self, slots, max_hp, damage):
+        """Apply an upgrade; current hp is clamped to the new max (like the JS build)."""
+        self.max_hp[slots] = max_hp
+        self.damage[slots] = damage
+        self.hp[slots] = np.minimum(self.hp[slots], max_hp)
+
+    def step(self, delta_sec):
+        """Advance every fighter; `delta_sec` is a scalar or one delta per owner."""
+        owner_dt = np.broadcast_to(np.asarray(delta_sec, dtype=float), (len(self.games),))
+        n = self.count
+        active = self.used[:n] & (owner_dt[self.owner[:n]] > 0)
+        for o in np.nonzero(owner_dt > 0)[0].tolist():
+            self.blocked_ids[o] = set()
+        if not active.any():
+            return
+
+        owner = self.owner[:n]
+        dt = owner_dt[owner]
+        x, y = self.x[:n], self.y[:n]
+        hp, dead = self.hp[:n], self.dead[:n]
+        target, cooldown = self.target[:n], self.cooldown[:n]
+
+        # 1) Respawns
+        respawn_timer = self.respawn_timer[:n]
+        waiting = active & dead
+        respawn_timer[waiting] -= dt[waiting]
+        revive = waiting & (respawn_timer <= 0)
+        hp[revive] = self.max_hp[:n][revive]
+        dead[revive] = False
+        alive = active & ~dead
+
+        # 2) Snapshot the enemies of every stepping game once. Each game.enemies
+        # stays in spawn (= id) order and owners go in order, so keys are sorted.
+        enemies = []
+        rows = []
+        for o, game in enumerate(self.games):
+            if game is None or owner_dt[o] <= 0:
+                continue
+            enemies.extend(game.enemies)
+            rows.extend((o, e["id"], e["x"], e["y"], e["width"], e["hp"],
+                         e["attackDamage"], e["attackInterval"], e["attackCooldown"]) for e in game.enemies)
+        m = len(enemies)
+        if m:
+            cols = np.array(rows, dtype=float)
+            eowner = cols[:, 0].astype(np.int64)
+            eids = (eowner << KEY_SHIFT) | cols[:, 1].astype(np.int64)
+            ex, ey, ehalf, ehp = cols[:, 2], cols[:, 3], cols[:, 4] / 2, cols[:, 5]
+            edmg, eint, ecool = cols[:, 6], cols[:, 7], cols[:, 8]
+            evalid = ehp > 0
+        else:
+            eids = np.zeros(0, dtype=np.int64)
+            evalid = np.zeros(0, dtype=bool)
+
+        # 3) Drop targets that died, left the map or moved out of reach
+        col = np.searchsorted(eids, target)
+        col_c = np.minimum(col, max(m - 1, 0))
+        engaged = alive & (target >= 0) & (col < m)
+        if m:
+            engaged &= (eids[col_c] == target) & evalid[col_c]
+            gap = np.hypot(ex[col_c] - x, ey[col_c] - y)
+            engaged &= gap <= self.engage_range[:n] + ehalf[col_c]
+        target[active & ~engaged] = -1
+
+        # 4) Free fighters walk back to their rally point
+        moving = alive & ~engaged
+        dx = self.rally_x[:n] - x
+        dy = self.rally_y[:n] - y
+        dist = np.hypot(dx, dy)
+        step = self.speed[:n] * dt
+        arrive = moving & (dist > 2) & (dist <= step)
+        walk = moving & (dist > step) & (dist > 2)
+        x[arrive] = self.rally_x[:n][arrive]
+        y[arrive] = self.rally_y[:n][arrive]
+        scale = np.divide(step, dist, out=np.zeros(n), where=walk)
+        x[walk] += dx[walk] * scale[walk]
+        y[walk] += dy[walk] * scale[walk]
+
+        # 5) Free fighters pick the nearest enemy of their own game within reach
+        free = np.nonzero(moving)[0]
+        if m and len(free):
+            d = np.hypot(ex[None, :] - x[free, None], ey[None, :] - y[free, None])
+            reach = self.engage_range[:n][free, None] + ehalf[None, :]
+            ok = (d <= reach) & evalid[None, :] & (eowner[None, :] == owner[free, None])
+            d = np.where(ok, d, np.inf)
+            best = d.argmin(axis=1)
+            found = np.isfinite(d[np.arange(len(free)), best])
+            hit = free[found]
+            target[hit] = eids[best[found]]
+            col[hit] = best[found]
+            engaged[hit] = True
+
+        if not m:
+            return
+
+        # 6) Fighters swing at their targets
+        fighting = np.nonzero(engaged)[0]
+        fcol = col[fighting]
+        cooldown[fighting] -= dt[fighting]
+        swing = cooldown[fighting] <= 0
+        cooldown[fighting[swing]] = self.attack_interval[:n][fighting[swing]]
+        enemy_damage = np.zeros(m)
+        np.add.at(enemy_damage, fcol[swing], self.damage[:n][fighting[swing]])
+
+        # 7) Blocked enemies stop and hit back at the first fighter holding them
+        blockers = fighting[self.blocks[:n][fighting]]
+        blocked_cols, first = np.unique(col[blockers], return_index=True)
+        ecool[blocked_cols] -= owner_dt[eowner[blocked_cols]]
+        e_swing = ecool[blocked_cols] <= 0
+        ecool[blocked_cols[e_swing]] = eint[blocked_cols[e_swing]]
+        fighter_damage = np.zeros(n)
+        np.add.at(fighter_damage, blockers[first[e_swing]], edmg[blocked_cols[e_swing]])
+
+        hp -= fighter_damage
+        died = alive & (hp <= 0)
+        hp[died] = 0
+        dead[died] = True
+        respawn_timer[died] = self.respawn_time[:n][died]
+        target[died] = -1
+
+        for c in blocked_cols.tolist():
+            self.blocked_ids[eowner[c]].add(enemies[c]["id"])
+
+        # 8) Write back only the enemies this tick actually touched
+        for c in np.union1d(np.nonzero(enemy_damage)[0], blocked_cols).tolist():
+            enemy = enemies[c]
+            if enemy_damage[c]:
+                self.games[eowner[c]].enemy_manager.damage_enemy(enemy, float(enemy_damage[c]))
+            enemy["attackCooldown"] = float(ecool[c])
@@ -0,0 +1,40 @@
+"""
+commands.py
+
+Player actions as small (code, a, b, c) integer tuples. Local clicks, remote
+clients and other front-ends all feed the same `apply_command()`, so every
+mutation a player can cause goes through a single, serializable path.
+"""
+
+PLACE = 1       # a = spot index, b = tower type id
+UPGRADE = 2     # a = spot index
+SEND_WAVE = 3
+SPEED = 4
+PAUSE = 5
+MOVE_HERO = 6   # a = hero index, b = x, c = y
+
+def apply_command(game, code, a=0, b=0, c=0):
+    """
+    Apply one command to `game`. Returns False for an unknown code, which is
+    ignored without output: servers call this on their tick loop with input
+    from remote peers, so the caller decides whether to count it.
+    """
+    if code == PLACE:
+        if 0 <= a < len(game.tower_spots) and 0 <= b < len(game.tower_manager.registry):
+            game.tower_manager.buy_tower(game.tower_spots[a], b)
+    elif code == UPGRADE:
+        tower = game.tower_manager.towers_by_spot.get(a)
+        if tower:
+            game.tower_manager.upgrade_tower(tower)
+    elif code == SEND_WAVE:
+        game.wave_manager.send_wave_early()
+    elif code == SPEED:
+        game.toggle_speed()
+    elif code == PAUSE:
+        game.toggle_pause()
+    elif code == MOVE_HERO:
+        if 0 <= a < len(game.hero_manager.heroes):
+            game.hero_manager.move_hero(game.hero_manager.heroes[a], b, c)
+    else:
+        return False
+    return True
@@ -0,0 +1,30 @@
+"""
+hero_config.py
+
+Starting heroes (mirroring the demo heroes added in js/main.js).
+"""
+
+HERO_DEFINITIONS = [
+    {
+        "name": "Knight Hero",
+        "x": 100,
+        "y": 100,
+        "maxHp": 200,
+        "damage": 15,
+        "isMelee": True,
+        "range": 20,        # Must be close
+        "speed": 80,
+        "attackInterval": 1.0,
+    },
+    {
+        "name": "Archer Hero",
+        "x": 150,
+        "y": 150,
+        "maxHp": 120,
+        "damage": 10,
+        "isMelee": False,   # Engages from further out and doesn't block
+        "range": 40,
+        "speed": 90,
+        "attackInterval": 1.2,
+    },
+]
@@ -0,0 +1,106 @@
+"""
+tower_config.py
+
+Tower definitions live here (mirroring js/data/towerConfig.js) so stats can be
+balanced or new types added without touching TowerManager logic.
+"""
+
+TOWER_DEFINITIONS = [
+    {
+        "type": "point",
+        "basePrice": 80,
+        "range": 169,
+        "splashRadius": 0,
+        "fireRate": 1.5,
+        "color": (0, 0, 255),
+        "upgrades": [
+            { "level": 1, "damage": 10, "upgradeCost": 0   },
+            { "level": 2, "damage": 15, "upgradeCost": 50  },
+            { "level": 3, "damage": 20, "upgradeCost": 100 },
+            { "level": 4, "damage": 25, "upgradeCost": 150 },
+        ],
+    },
+    {
+        "type": "splash",
+        "basePrice": 80,
+        "range": 104,
+        "splashRadius": 50,
+        "fireRate": 1.5,
+        "color": (255, 0, 0),
+        "upgrades": [
+            { "level": 1, "damage": 8,  "upgradeCost": 0   },
+            { "level": 2, "damage": 12, "upgradeCost": 50  },
+            { "level": 3, "damage": 16, "upgradeCost": 100 },
+            { "level": 4, "damage": 20, "upgradeCost": 150 },
+        ],
+    },
+    {
+        # Doesn't shoot: spawns a squad of melee soldiers that block the path.
+        # range/splashRadius/fireRate are kept only so every type has the same shape.
+        "type": "barracks",
+        "kind": "barracks",
+        "basePrice": 100,
+        "range": 0,
+        "splashRadius": 0,
+        "fireRate": 0,
+        "color": (139, 69, 19),
+        "upgrades": [
+            { "level": 1, "soldierHp": 50,  "soldierDmg": 5,  "upgradeCost": 0   },
+            { "level": 2, "soldierHp": 70,  "soldierDmg": 7,  "upgradeCost": 60  },
+            { "level": 3, "soldierHp": 90,  "soldierDmg": 9,  "upgradeCost": 120 },
+            { "level": 4, "soldierHp": 120, "soldierDmg": 12, "upgradeCost": 180 },
+        ],
+    },
+    {
+        "type": "frost",
+        "basePrice": 90,
+        "range": 130,
+        "splashRadius": 0,
+        "fireRate": 1.5,
+        "color": (120, 200, 255),
+        "effects": [
+            { "kind": "slow", "amount": 0.4, "duration": 2.0 },
+        ],
+        "upgrades": [
+            { "level": 1, "damage": 4,  "upgradeCost": 0   },
+            { "level": 2, "damage": 6,  "upgradeCost": 50  },
+            { "level": 3, "damage": 8,  "upgradeCost": 100 },
+            { "level": 4, "damage": 10, "upgradeCost": 150 },
+        ],
+    },
+    {
+        "type": "flame",
+        "basePrice": 100,
+        "range": 104,
+        "splashRadius": 40,
+        "fireRate": 1.5,
+        "color": (255, 140, 0),
+        "effects": [
+            { "kind": "burn", "amount": 6, "duration": 3.0 },
+        ],
+        "upgrades": [
+            { "level": 1, "damage": 4,  "upgradeCost": 0   },
+            { "level": 2, "damage": 6,  "upgradeCost": 60  },
+            { "level": 3, "damage": 8,  "upgradeCost": 110 },
+            { "level": 4, "damage": 10, "upgradeCost": 160 },
+        ],
+    },
+    {
+        "type": "acid",
+        "basePrice": 100,
+        "range": 150,
+        "splashRadius": 0,
+        "fireRate": 1.5,
+        "color": (120, 220, 60),
+        "effects": [
+            { "kind": "poison", "amount": 3, "duration": 4.0, "maxStacks": 5 },
+            { "kind": "shred", "amount": 0.1, "duration": 4.0, "maxStacks": 5 },
+        ],
+        "upgrades": [
+            { "level": 1, "damage": 3, "upgradeCost": 0   },
+            { "level": 2, "damage": 5, "upgradeCost": 60  },
+            { "level": 3, "damage": 7, "upgradeCost": 110 },
+            { "level": 4, "damage": 9, "upgradeCost": 160 },
+        ],
+    },
+]
@@ -1,32 +1,42 @@
 import pygame
-import math
-import random
 import os
 
+from assets import load_image
+from event_bus import EventType
+
 class EnemyManager:
     def __init__(self, game):
         self.game = game
+        self.next_enemy_id = 0
 
         self.enemy_base_data = {
             "drone": {
                 "baseHp": 30,
                 "gold": 5,
                 "baseSpeed": 80,
+                "attackDamage": 3,
+                "attackInterval": 1.0,
             },
             "leaf_blower": {
                 "baseHp": 60,
                 "gold": 8,
                 "baseSpeed": 60,
+                "attackDamage": 5,
+                "attackInterval": 1.2,
             },
             "trench_digger": {
                 "baseHp": 100,
                 "gold": 12,
                 "baseSpeed": 30,
+                "attackDamage": 8,
+                "attackInterval": 1.5,
             },
             "trench_walker": {
                 "baseHp": 150,
                 "gold": 15,
                 "baseSpeed": 25,
+                "attackDamage": 10,
+                "attackInterval": 1.5,
             }
         }
 
@@ -34,54 +44,58 @@ class EnemyManager:
         for e_type in self.enemy_base_data.keys():
             image_path = os.path.join("assets", "enemies", f"{e_type}.png")
             if os.path.exists(image_path):
-                img = pygame.image.load(image_path)
-                max_dim = 30
-                iw, ih = img.get_size()
-                scale = max_dim / max(iw, ih)
-                new_size = (int(iw * scale), int(ih * scale))
-                scaled_img = pygame.transform.scale(img, new_size)
-                self.loaded_enemy_assets[e_type] = scaled_img
+                self.loaded_enemy_assets[e_type] = load_image(image_path, max_dim=30)
             else:
                 print(f"Warning: {image_path} not found.")
                 surface = pygame.Surface((30,30))
                 surface.fill((255,0,0))
                 self.loaded_enemy_assets[e_type] = surface
 
+        # Largest sprite side; click hit-testing widens enemy-grid queries by half of this
+        self.max_enemy_size = max(
+            max(img.get_width(), img.get_height()) for img in self.loaded_enemy_assets.values()
+        )
+
     def update(self, delta_sec):
+        bus = self.game.event_bus
         to_remove = []
         for enemy in self.game.enemies:
             self.update_enemy(enemy, delta_sec)
             if enemy["hp"] <= 0:
                 self.game.gold += enemy["gold"]
+                bus.emit(EventType.KILL, enemy["id"], enemy["gold"], enemy["x"], enemy["y"])
                 to_remove.append(enemy)
             else:
-                if enemy["waypointIndex"] >= len(self.game.path):
+                if enemy["distance"] >= enemy["route"].length:
                     self.game.lives -= 1
+                    bus.emit(EventType.LEAK, enemy["id"], self.game.lives)
                     if self.game.lives <= 0:
                         self.game.lives = 0
                         self.game.paused = True
-                        print("Game Over")
+                        bus.emit(EventType.GAME_OVER, self.game.wave_manager.wave_index)
                     to_remove.append(enemy)
 
-        self.game.enemies = [e for e in self.game.enemies if e not in to_remove]
+        removed_ids = set()
+        for enemy in to_remove:
+            enemy["dead"] = True
+            self.game.effects.release(enemy)
+            removed_ids.add(enemy["id"])
+        self.game.enemies = [e for e in self.game.enemies if e["id"] not in removed_ids]
+
+        # Re-bucket survivors once so towers can look up "who's near me" cheaply
+        self.game.enemy_grid.rebuild(self.game.enemies)
 
     def update_enemy(self, enemy, delta_sec):
-        path = self.game.path
-        if enemy["waypointIndex"] < len(path):
-            next_wp = path[enemy["waypointIndex"]]
-            ex, ey = enemy["x"], enemy["y"]
-            tx, ty = next_wp
-            dx, dy = tx - ex, ty - ey
-            dist = math.hypot(dx, dy)
-            step = enemy["speed"] * delta_sec
-
-            if dist <= step:
-                enemy["x"] = tx
-                enemy["y"] = ty
-                enemy["waypointIndex"] += 1
-            else:
-                enemy["x"] += (dx / dist) * step
-                enemy["y"] += (dy / dist) * step
+        # Held in place by a soldier or hero
+        if enemy["id"] in self.game.combat.blocked_ids[self.game.batch_index]:
+            return
+
+        # Advance along the precompiled route; position is a table lookup.
+        # Slows are already folded into speed_mult by the effects pass.
+        enemy["distance"] += enemy["speed"] * self.game.effects.speed_mult[enemy["fxSlot"]] * delta_sec
+        enemy["x"], enemy["y"], enemy["segment"] = enemy["route"].point_at(
+            enemy["distance"], enemy["segment"]
+        )
 
     def draw_enemy(self, screen, enemy):
         img = enemy["image"]
@@ -97,20 +111,24 @@ class EnemyManager:
             pygame.draw.rect(screen, (255,0,0), (bar_x, bar_y, bar_w, bar_h))
             pygame.draw.rect(screen, (0,255,0), (bar_x, bar_y, bar_w * pct, bar_h))
 
-    def spawn_enemy(self, e_type, hp_multiplier=1.0):
+    def spawn_enemy(self, e_type, hp_multiplier=1.0, route=None):
+        """`route` optionally pins the spawn to a route or entrance name."""
         base_data = self.enemy_base_data.get(e_type, self.enemy_base_data["drone"])
         asset = self.loaded_enemy_assets.get(e_type, self.loaded_enemy_assets["drone"])
 
         final_hp = base_data["baseHp"] * 0.8 * hp_multiplier
-        speed_factor = 0.8 + random.random() * 0.4
+        speed_factor = 0.8 + self.game.rng.random() * 0.4
         final_speed = base_data["baseSpeed"] * speed_factor
 
-        if not self.game.path:
+        if not self.game.routes.routes:
             print("No path defined, cannot spawn enemy!")
             return
 
-        first_wp = self.game.path[0]
+        route_index = self.game.routes.pick(route, self.game.rng)
+        route_obj = self.game.routes.routes[route_index]
+        first_wp = route_obj.points[0]
         enemy = {
+            "id": self.next_enemy_id,
             "name": e_type,
             "image": asset,
             "width": asset.get_width(),
@@ -121,7 +139,19 @@ class EnemyManager:
             "baseHp": final_hp,
             "speed": final_speed,
             "gold": base_data["gold"],
-            "waypointIndex": 1,
+            "attackDamage": base_data["attackDamage"],
+            "attackInterval": base_data["attackInterval"],
+            "attackCooldown": 0.0,
+            "route": route_obj,
+            "distance": 0.0,
+            "segment": 0,
             "dead": False
         }
+        self.next_enemy_id += 1
+        self.game.effects.attach(enemy, self.game.batch_index)
         self.game.enemies.append(enemy)
+        self.game.event_bus.emit(EventType.SPAWN, enemy["id"], e_type, route_index, final_hp)
+
+    def damage_enemy(self, enemy, amount):
+        """Every hit goes through here so armor shred (damage taken) applies."""
+        enemy["hp"] -= amount * self.game.effects.damage_mult[enemy["fxSlot"]]
@@ -0,0 +1,73 @@
+from enum import IntEnum
+
+class EventType(IntEnum):
+    SPAWN = 1
+    KILL = 2
+    LEAK = 3
+    SHOT = 4
+    BUILD = 5
+    UPGRADE = 6
+    WAVE_START = 7
+    WAVE_END = 8
+    GAME_OVER = 9
+    LEVEL_LOADED = 10
+
+# Meaning of the positional payload (a, b, c, d) for each event type
+EVENT_FIELDS = {
+    EventType.SPAWN:        ("enemyId", "enemyType", "route", "hp"),
+    EventType.KILL:         ("enemyId", "gold", "x", "y"),
+    EventType.LEAK:         ("enemyId", "livesLeft"),
+    EventType.SHOT:         ("towerId", "enemyId", "damage"),
+    EventType.BUILD:        ("towerId", "towerType", "spot", "cost"),
+    EventType.UPGRADE:      ("towerId", "level", "cost"),
+    EventType.WAVE_START:   ("wave",),
+    EventType.WAVE_END:     ("wave",),
+    EventType.GAME_OVER:    ("wave",),
+    EventType.LEVEL_LOADED: ("waveCount",),
+}
+
+class EventBus:
+    """
+    Fixed-size ring buffer of game events.
+
+    `emit()` is meant for the hot loop: it stores one tuple in a preallocated
+    slot and bumps a counter, with no locks, allocation of buffers or I/O.
+    A single consumer (e.g. TelemetryWriter on its own thread) calls `drain()`
+    to take everything emitted since its last call. If the consumer falls a
+    full buffer behind, new events are dropped and counted rather than
+    stalling the game.
+    """
+    def __init__(self, capacity=8192):
+        self.capacity = capacity
+        self.buffer = [None] * capacity
+        self.head = 0      # total events written (producer only)
+        self.tail = 0      # total events consumed (consumer only)
+        self.dropped = 0
+        self.time = 0.0    # simulation clock stamped on each event
+
+    def advance(self, delta_sec):
+        self.time += delta_sec
+
+    def emit(self, etype, a=None, b=None, c=None, d=None):
+        head = self.head
+        if head - self.tail >= self.capacity:
+            self.dropped += 1
+            return
+        self.buffer[head % self.capacity] = (self.time, etype, a, b, c, d)
+        # Publish only after the slot is filled so the consumer never sees a stale one
+        self.head = head + 1
+
+    def drain(self):
+        """Return (and consume) all events emitted since the last drain."""
+        head = self.head
+        tail = self.tail
+        cap = self.capacity
+        start, end = tail % cap, head % cap
+        if head == tail:
+            return []
+        if start < end:
+            batch = self.buffer[start:end]
+        else:
+            batch = self.buffer[start:] + self.buffer[:end]
+        self.tail = head
+        return batch
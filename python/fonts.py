@@ -0,0 +1,31 @@
+"""
+fonts.py
+
+One place to get pygame Font objects. pygame.font.SysFont() walks the
+system font list (fc-list on Linux) the first time it is called, even for
+SysFont(None, ...), which only ever ends up at pygame's bundled default font.
+Here `get_font(size)` opens that bundled file directly and each size is
+built once per process, so no launch ever pays for the scan.
+
+    font = get_font(20)
+    label = font.render("Gold", True, (255, 255, 255))
+"""
+import pygame
+
+class FontRegistry:
+    def __init__(self):
+        self.fonts = {}  # size -> pygame.font.Font
+
+    def get(self, size):
+        font = self.fonts.get(size)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = pygame.font.Font(None, size)
+            self.fonts[size] = font
+        return font
+
+registry = FontRegistry()
+
+def get_font(size):
+    return registry.get(size)
@@ -1,15 +1,36 @@
 import pygame
-import os
+import copy
+import random
 
 from wave_manager import WaveManager
 from enemy_manager import EnemyManager
 from tower_manager import TowerManager
 from ui_manager import UIManager
+from unit_manager import UnitManager
+from hero_manager import HeroManager
+from combat_engine import CombatEngine
+from status_effects import StatusEffectEngine
+from spatial_grid import SpatialGrid
+from event_bus import EventBus
+from assets import load_image
+from fonts import get_font
+from path_graph import compile_routes
+from data.hero_config import HERO_DEFINITIONS
+from maps.level1 import LEVEL1_DATA
 
 class Game:
-    def __init__(self, width, height):
+    def __init__(self, width, height, level_data=LEVEL1_DATA, event_bus=None, seed=None,
+                 combat=None, effects=None, batch_index=0):
         self.width = width
         self.height = height
+        self.level_data = level_data
+
+        # All gameplay randomness draws from here so a seeded game replays exactly
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+        # Kept across restarts so a telemetry writer keeps draining the same bus
+        self.event_bus = event_bus if event_bus is not None else EventBus()
 
         # Speed handling (like JS: [1,2,4,0.5])
         self.speedOptions = [1, 2, 4, 0.5]
@@ -30,140 +51,83 @@ class Game:
 
         # Enemies, towers, spots, path
         self.enemies = []
+        self.enemy_grid = SpatialGrid(cell_size=64)
         self.tower_spots = []
         self.path = []
+        self.routes = None
         self.background_img = None
 
-        # Managers
+        # Managers. The combat and effect engines can be shared with other
+        # games (see VectorTowerDefenseEnv); this game is `batch_index` in them.
+        self.batch_index = batch_index
+        self.combat = combat if combat is not None else CombatEngine()
+        self.effects = effects if effects is not None else StatusEffectEngine()
+        self.combat.add_game(self, batch_index)
+        self.effects.add_game(self, batch_index)
         self.wave_manager = WaveManager(self)
         self.enemy_manager = EnemyManager(self)
         self.tower_manager = TowerManager(self)
+        self.unit_manager = UnitManager(self)
+        self.hero_manager = HeroManager(self)
         self.ui_manager = UIManager(self)
 
         # Load level data
         self.load_level_data()
 
+        for hero_def in HERO_DEFINITIONS:
+            self.hero_manager.add_hero(hero_def)
+
     def load_level_data(self):
-        level1Data = {
-            "background": "assets/maps/level1.png",
-            "mapWidth": 3530,
-            "mapHeight": 2365,
-            "path": [
-                {"x": 420,  "y": 0},
-                {"x": 800,  "y": 860},
-                {"x": 1300, "y": 1550},
-                {"x": 1500, "y": 1750},
-                {"x": 1950, "y": 1920},
-                {"x": 3530, "y": 1360},
-            ],
-            "towerSpots": [
-                {"x": 1020, "y": 660},
-                {"x": 620,  "y": 1280},
-                {"x": 1340, "y": 1080},
-                {"x": 1020, "y": 1660},
-                {"x": 1800, "y": 1560},
-                {"x": 2080, "y": 2150},
-                {"x": 3250, "y": 1150},
-            ],
-            "waves": [
-                {
-                  "enemyGroups": [
-                    {"type": "drone", "count": 5, "spawnInterval": 800, "hpMultiplier": 1.0},
-                  ],
-                },
-                {
-                  "enemyGroups": [
-                    {"type": "drone", "count": 3, "spawnInterval": 700, "hpMultiplier": 1.1},
-                    {"type": "leaf_blower", "count": 2, "spawnInterval": 1200, "hpMultiplier": 1.1},
-                  ],
-                },
-                {
-                  "enemyGroups": [
-                    {"type": "leaf_blower", "count": 4, "spawnInterval": 1000, "hpMultiplier": 1.2},
-                    {"type": "drone", "count": 3, "spawnInterval": 700, "hpMultiplier": 1.2},
-                  ],
-                },
-                {
-                  "enemyGroups": [
-                    {"type": "trench_digger", "count": 4, "spawnInterval": 900, "hpMultiplier": 1.3},
-                    {"type": "drone", "count": 4, "spawnInterval": 600, "hpMultiplier": 1.3},
-                  ],
-                },
-                {
-                  "enemyGroups": [
-                    {"type": "trench_digger", "count": 5, "spawnInterval": 800, "hpMultiplier": 1.4},
-                    {"type": "leaf_blower", "count": 4, "spawnInterval": 1200, "hpMultiplier": 1.4},
-                  ],
-                },
-                {
-                  "enemyGroups": [
-                    {"type": "trench_walker", "count": 3, "spawnInterval": 1200, "hpMultiplier": 1.5},
-                    {"type": "drone", "count": 4, "spawnInterval": 600, "hpMultiplier": 1.5},
-                  ],
-                },
-                {
-                  "enemyGroups": [
-                    {"type": "trench_walker", "count": 4, "spawnInterval": 1200, "hpMultiplier": 1.6},
-                    {"type": "leaf_blower", "count": 3, "spawnInterval": 900, "hpMultiplier": 1.6},
-                  ],
-                },
-                {
-                  "enemyGroups": [
-                    {"type": "drone", "count": 6, "spawnInterval": 600, "hpMultiplier": 1.7},
-                    {"type": "leaf_blower", "count": 4, "spawnInterval": 900, "hpMultiplier": 1.7},
-                    {"type": "trench_digger", "count": 2, "spawnInterval": 800, "hpMultiplier": 1.7},
-                  ],
-                },
-                {
-                  "enemyGroups": [
-                    {"type": "trench_digger", "count": 5, "spawnInterval": 700, "hpMultiplier": 1.8},
-                    {"type": "trench_walker", "count": 3, "spawnInterval": 1300, "hpMultiplier": 1.8},
-                  ],
-                },
-                {
-                  "enemyGroups": [
-                    {"type": "trench_walker", "count": 6, "spawnInterval": 1000, "hpMultiplier": 1.9},
-                    {"type": "leaf_blower", "count": 5, "spawnInterval": 1000, "hpMultiplier": 1.9},
-                  ],
-                },
-            ],
-        }
-
-        bg_path = level1Data["background"]
-        if os.path.exists(bg_path):
-            self.background_img = pygame.image.load(bg_path)
-        else:
-            print("Warning: background image not found at", bg_path)
+        # Copied so wave bookkeeping (spawnedCount, timers) never leaks into the shared data
+        levelData = copy.deepcopy(self.level_data)
 
-        map_w = level1Data["mapWidth"]
-        map_h = level1Data["mapHeight"]
+        self.background_img = load_image(levelData["background"], optional=True)
+
+        map_w = levelData["mapWidth"]
+        map_h = levelData["mapHeight"]
         scale_x = self.width / map_w
         scale_y = self.height / map_h
 
-        # Build scaled path
-        self.path = []
-        for pt in level1Data["path"]:
-            self.path.append((int(pt["x"] * scale_x), int(pt["y"] * scale_y)))
+        # Compile lanes into routes (arc-length tables). `path` stays as the
+        # first route for code that only cares about "the" path.
+        self.routes = compile_routes(levelData, scale_x, scale_y)
+        self.path = self.routes.routes[0].points if self.routes.routes else []
 
         # Tower spots
         self.tower_spots = []
-        for s in level1Data["towerSpots"]:
+        for i, s in enumerate(levelData["towerSpots"]):
             self.tower_spots.append({
+                "index": i,
                 "x": int(s["x"] * scale_x),
                 "y": int(s["y"] * scale_y),
                 "occupied": False
             })
+        self.ui_manager.hit_tester.rebuild_spots(self.tower_spots)
 
         # Waves
-        self.wave_manager.load_waves_from_level(level1Data)
+        self.wave_manager.load_waves_from_level(levelData)
 
     def update(self, delta_sec):
         # Multiply by game speed if not paused
         if not self.paused:
             delta_sec *= self.gameSpeed
-            self.wave_manager.update(delta_sec)
-            self.enemy_manager.update(delta_sec)
-            self.tower_manager.update(delta_sec)
+            self.update_waves(delta_sec)
+            # Expire effects and apply damage-over-time before enemies move,
+            # so DoT kills and slowed speeds are handled this same tick
+            self.effects.step(delta_sec)
+            self.update_field(delta_sec)
+            # Soldiers + heroes vs enemies, resolved in one batched pass
+            self.combat.step(delta_sec)
+
+    # The per-game parts of a tick, for drivers that step the shared engines
+    # themselves (VectorTowerDefenseEnv.tick)
+    def update_waves(self, delta_sec):
+        self.event_bus.advance(delta_sec)
+        self.wave_manager.update(delta_sec)
+
+    def update_field(self, delta_sec):
+        self.enemy_manager.update(delta_sec)
+        self.tower_manager.update(delta_sec)
 
     def draw(self, screen):
         if self.background_img:
@@ -182,22 +146,27 @@ class Game:
         # Towers
         self.tower_manager.draw_towers(screen)
 
+        # Soldiers and heroes
+        self.unit_manager.draw(screen)
+        self.hero_manager.draw(screen, self.ui_manager.selected_hero)
+
         # Debug spots + path
         if self.debug_mode:
             for i, spot in enumerate(self.tower_spots):
                 pygame.draw.circle(screen, (0,255,0), (spot["x"], spot["y"]), 10)
-                fontD = pygame.font.SysFont(None, 16)
+                fontD = get_font(16)
                 lbl = fontD.render(f"T{i}", True, (255,255,255))
                 screen.blit(lbl, (spot["x"] - 12, spot["y"] - 20))
 
-            for i, wp in enumerate(self.path):
-                pygame.draw.circle(screen, (255,255,0), wp, 5)
-                fontD = pygame.font.SysFont(None, 16)
-                lbl = fontD.render(f"P{i}", True, (255,255,255))
-                screen.blit(lbl, (wp[0] - 12, wp[1] - 20))
+            for route in self.routes.routes:
+                for i, wp in enumerate(route.points):
+                    pygame.draw.circle(screen, (255,255,0), wp, 5)
+                    fontD = get_font(16)
+                    lbl = fontD.render(f"P{i}", True, (255,255,255))
+                    screen.blit(lbl, (wp[0] - 12, wp[1] - 20))
 
         # HUD text (gold, wave, lives)
-        font = pygame.font.SysFont(None, 24)
+        font = get_font(24)
         gold_txt = font.render(f"Gold: {self.gold}", True, (255,255,255))
         wave_txt = font.render(f"Wave: {self.wave_manager.wave_index+1}/{len(self.wave_manager.waves)}", True, (255,255,255))
         lives_txt = font.render(f"Lives: {self.lives}", True, (255,255,255))
@@ -238,7 +207,8 @@ class Game:
 
     def resetGame(self, newGold):
         # Re-init the entire game
-        self.__init__(self.width, self.height)
+        self.__init__(self.width, self.height, self.level_data, self.event_bus, self.seed,
+                      self.combat, self.effects, self.batch_index)
         self.startingGold = newGold
         self.gold = newGold
         self.lives = 20
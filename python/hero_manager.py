@@ -0,0 +1,67 @@
+import pygame
+
+class HeroManager:
+    """
+    Heroes (the Python side of js/heroManager.js). Like barracks soldiers, a
+    hero's position, hp and fighting state are a fighter slot in the shared
+    CombatEngine; the hero dict keeps only what's hero-specific.
+    """
+    def __init__(self, game):
+        self.game = game
+        self.heroes = []
+
+    def add_hero(self, config):
+        is_melee = config.get("isMelee", True)
+        slot = self.game.combat.add_fighter({
+            "x": config.get("x", 400),
+            "y": config.get("y", 300),
+            "maxHp": config.get("maxHp", 100),
+            "damage": config.get("damage", 10),
+            "attackInterval": config.get("attackInterval", 1.0),
+            "engagementRange": config.get("range", 20),
+            "speed": config.get("speed", 80),
+            # Only melee heroes physically hold enemies in place
+            "blocks": is_melee,
+        }, self.game.batch_index)
+        hero = {
+            "name": config.get("name", "Hero"),
+            "radius": config.get("radius", 20),
+            "isMelee": is_melee,
+            "slot": slot,
+        }
+        self.heroes.append(hero)
+        return hero
+
+    def move_hero(self, hero, tx, ty):
+        self.game.combat.set_rally(hero["slot"], tx, ty)
+
+    def get_hero_at(self, mx, my):
+        # Only a couple of heroes exist, so a direct check is cheapest
+        combat = self.game.combat
+        for hero in self.heroes:
+            dx = mx - combat.x[hero["slot"]]
+            dy = my - combat.y[hero["slot"]]
+            if dx*dx + dy*dy <= hero["radius"] ** 2:
+                return hero
+        return None
+
+    def draw(self, screen, selected=None):
+        combat = self.game.combat
+        for hero in self.heroes:
+            slot = hero["slot"]
+            x, y = int(combat.x[slot]), int(combat.y[slot])
+            rad = hero["radius"]
+            if combat.dead[slot]:
+                color = (128,128,128)
+            else:
+                color = (72,61,139) if hero["isMelee"] else (85,107,47)
+            pygame.draw.circle(screen, color, (x, y), rad)
+            if hero is selected:
+                pygame.draw.circle(screen, (255,255,0), (x, y), rad + 2, 2)
+
+            hp, max_hp = combat.hp[slot], combat.max_hp[slot]
+            if not combat.dead[slot] and hp < max_hp:
+                bar_w = 40
+                pct = hp / max_hp
+                pygame.draw.rect(screen, (255,0,0), (x - bar_w/2, y - rad - 12, bar_w, 5))
+                pygame.draw.rect(screen, (0,255,0), (x - bar_w/2, y - rad - 12, bar_w * pct, 5))
@@ -0,0 +1,58 @@
+from spatial_grid import SpatialGrid
+
+class HitTester:
+    """
+    Resolves a click to whatever is under it without scanning every widget,
+    spot or enemy:
+
+    - UI widgets and tower spots are static, so they're bucketed once into
+      their own grids and a click only checks the handful sharing its cell.
+    - Enemies reuse the per-tick enemy grid the simulation already maintains.
+    """
+    SPOT_RADIUS = 10
+
+    def __init__(self, game, cell_size=32):
+        self.game = game
+        self.widget_grid = SpatialGrid(cell_size)
+        self.spot_grid = SpatialGrid(cell_size)
+
+    def rebuild_widgets(self, buttons):
+        self.widget_grid.clear()
+        for btn in buttons:
+            if btn["x"] is None or btn["y"] is None:
+                continue
+            self.widget_grid.insert_rect(btn["x"], btn["y"], btn["x"] + btn["w"], btn["y"] + btn["h"], btn)
+
+    def rebuild_spots(self, spots):
+        r = self.SPOT_RADIUS
+        self.spot_grid.clear()
+        for spot in spots:
+            self.spot_grid.insert_rect(spot["x"] - r, spot["y"] - r, spot["x"] + r, spot["y"] + r, spot)
+
+    def widget_at(self, mx, my):
+        for btn in self.widget_grid.at_point(mx, my):
+            if (mx >= btn["x"] and mx <= btn["x"] + btn["w"] and
+                my >= btn["y"] and my <= btn["y"] + btn["h"]):
+                return btn
+        return None
+
+    def spot_at(self, mx, my):
+        r2 = self.SPOT_RADIUS * self.SPOT_RADIUS
+        for spot in self.spot_grid.at_point(mx, my):
+            dx = mx - spot["x"]
+            dy = my - spot["y"]
+            if dx*dx + dy*dy <= r2:
+                return spot
+        return None
+
+    def enemy_at(self, mx, my):
+        """Oldest enemy whose sprite box contains the click, or None."""
+        # Enemy grid is keyed by center, so widen the query by the largest half-sprite
+        half = self.game.enemy_manager.max_enemy_size / 2
+        best = None
+        for enemy in self.game.enemy_grid.query_rect(mx - half, my - half, mx + half, my + half):
+            if (abs(mx - enemy["x"]) <= enemy["width"] / 2 and
+                abs(my - enemy["y"]) <= enemy["height"] / 2):
+                if best is None or enemy["id"] < best["id"]:
+                    best = enemy
+        return best
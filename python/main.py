@@ -1,20 +1,81 @@
+import time
+_process_start = time.perf_counter()
+
+import argparse
 import pygame
 from game import Game
+from telemetry import TelemetryWriter
+from remote_client import RemoteClient
+from split_mode import SplitSimulation
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Tower Defense in Python")
+    parser.add_argument("--telemetry", metavar="DIR",
+                        help="write a compressed per-session event log into DIR")
+    parser.add_argument("--connect", metavar="HOST:PORT",
+                        help="render a game running in server.py instead of simulating locally")
+    parser.add_argument("--split", action="store_true",
+                        help="run the simulation in a separate process and only render here")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="print how long each startup phase took, up to the first frame")
+    return parser.parse_args()
+
+class StartupTimer:
+    """Wall-clock time per startup phase, measured from process start."""
+    def __init__(self, start):
+        self.last = start
+        self.phases = []
+
+    def mark(self, name):
+        now = time.perf_counter()
+        self.phases.append((name, now - self.last))
+        self.last = now
+
+    def report(self):
+        total = sum(seconds for _, seconds in self.phases)
+        for name, seconds in self.phases:
+            print(f"  {name:<14}{seconds * 1000:8.1f} ms")
+        print(f"  {'total':<14}{total * 1000:8.1f} ms")
 
 def main():
-    # 1) Initialize pygame
-    pygame.init()
+    args = parse_args()
+    timer = StartupTimer(_process_start)
+    timer.mark("imports")
+
+    # 1) Initialize only what we use; pygame.init() would also bring up
+    #    audio, joysticks etc. that the game never touches
+    pygame.display.init()
+    pygame.font.init()
+    timer.mark("init")
     
     # 2) Create window
     width, height = 800, 600
     screen = pygame.display.set_mode((width, height))
     pygame.display.set_caption("Tower Defense in Python")
+    timer.mark("window")
     
     # 3) Create a clock for managing FPS
     clock = pygame.time.Clock()
     
     # 4) Create our main Game object
     game = Game(width, height)
+    timer.mark("game")
+
+    # Thin-renderer mode: the server simulates, we only mirror and draw
+    remote = None
+    if args.connect:
+        host, port = args.connect.rsplit(":", 1)
+        remote = RemoteClient(host, int(port))
+        remote.attach(game)
+    elif args.split:
+        # Same mirror approach, but the simulation lives in a local process
+        remote = SplitSimulation(width, height)
+        remote.attach(game)
+
+    # Optional event log; all disk I/O happens on the writer's own thread
+    telemetry = None
+    if args.telemetry:
+        telemetry = TelemetryWriter.for_session(game.event_bus, args.telemetry).start()
 
     # 5) Main loop
     running = True
@@ -32,7 +93,10 @@ def main():
                 game.handle_mouse_click(mx, my)
         
         # Update game logic
-        game.update(delta_sec)
+        if remote:
+            remote.apply_pending(game, delta_sec)
+        else:
+            game.update(delta_sec)
 
         # Draw everything
         screen.fill((0, 0, 0))  # black background if no map loaded
@@ -41,6 +105,17 @@ def main():
         # Flip the display buffer
         pygame.display.flip()
 
+        if timer:
+            timer.mark("first frame")
+            if args.startup_report:
+                print("Startup:")
+                timer.report()
+            timer = None
+
+    if telemetry:
+        telemetry.stop()
+    if remote:
+        remote.close()
     pygame.quit()
 
 if __name__ == "__main__":
@@ -0,0 +1,138 @@
+"""
+path_graph.py
+
+Compiles a level's lanes into routes that enemies can follow by table lookup.
+
+A level either has a single "path" (list of waypoints), or a "pathGraph":
+
+    "pathGraph": {
+        "nodes": {"north": {"x": 420, "y": 0}, "fork": {...}, "exit": {...}},
+        "edges": [
+            {"from": "north", "to": "fork"},
+            {"from": "fork", "to": "exit", "weight": 2, "via": [{"x": .., "y": ..}]},
+            ...
+        ],
+        "entrances": {"north": 1.0, "west": 0.5},   # spawn weight per entrance
+    }
+
+Edges are directed; nodes with no outgoing edge are exits. Lanes can fork
+(an edge "weight" splits traffic between siblings) and merge again. Every
+entrance -> exit walk becomes a Route with a cumulative arc-length table, so
+moving an enemy is "distance += speed * dt" plus a table lookup, never
+pathfinding.
+"""
+import bisect
+import math
+import random
+
+class Route:
+    def __init__(self, name, points, weight, entrance):
+        self.name = name
+        self.points = points
+        self.weight = weight
+        self.entrance = entrance
+
+        # cum[i] = distance along the route at points[i]
+        self.cum = [0.0]
+        for (ax, ay), (bx, by) in zip(points, points[1:]):
+            self.cum.append(self.cum[-1] + math.hypot(bx - ax, by - ay))
+        self.length = self.cum[-1]
+
+    def point_at(self, distance, segment=0):
+        """
+        Position `distance` along the route. `segment` is a hint (the segment
+        the enemy was on last tick); since enemies only move forward this is
+        usually a no-op check. Returns (x, y, segment).
+        """
+        cum = self.cum
+        last = len(cum) - 2
+        if last < 0:
+            x, y = self.points[0]
+            return x, y, 0
+        while segment < last and cum[segment + 1] <= distance:
+            segment += 1
+        seg_len = cum[segment + 1] - cum[segment]
+        t = 0.0 if seg_len == 0 else (distance - cum[segment]) / seg_len
+        t = min(1.0, max(0.0, t))
+        (ax, ay), (bx, by) = self.points[segment], self.points[segment + 1]
+        return ax + (bx - ax) * t, ay + (by - ay) * t, segment
+
+class RouteTable:
+    """All compiled routes of a level plus cached weighted pickers per selector."""
+    def __init__(self, routes):
+        self.routes = routes
+        self.pickers = {}
+
+    def picker(self, selector=None):
+        """
+        `selector` narrows the candidates: None = all routes, otherwise a route
+        name or an entrance name (as set on a wave group's "route" key).
+        """
+        if selector not in self.pickers:
+            if selector is None:
+                idx = list(range(len(self.routes)))
+            else:
+                idx = [i for i, r in enumerate(self.routes) if r.name == selector]
+                if not idx:
+                    idx = [i for i, r in enumerate(self.routes) if r.entrance == selector]
+                if not idx:
+                    print(f"Warning: unknown route '{selector}', using all routes")
+                    idx = list(range(len(self.routes)))
+            acc = []
+            total = 0.0
+            for i in idx:
+                total += self.routes[i].weight
+                acc.append(total)
+            self.pickers[selector] = (idx, acc, total)
+        return self.pickers[selector]
+
+    def pick(self, selector=None, rng=random):
+        idx, acc, total = self.picker(selector)
+        k = bisect.bisect_right(acc, rng.random() * total)
+        return idx[min(k, len(idx) - 1)]
+
+def compile_routes(level_data, scale_x=1.0, scale_y=1.0):
+    """Build a RouteTable from a level's "pathGraph" (or plain "path")."""
+    def scaled(pt):
+        return (int(pt["x"] * scale_x), int(pt["y"] * scale_y))
+
+    graph = level_data.get("pathGraph")
+    if not graph:
+        points = [scaled(pt) for pt in level_data.get("path", [])]
+        if not points:
+            return RouteTable([])
+        return RouteTable([Route("main", points, 1.0, "main")])
+
+    nodes = graph["nodes"]
+    out_edges = {name: [] for name in nodes}
+    for edge in graph["edges"]:
+        out_edges[edge["from"]].append(edge)
+
+    routes = []
+
+    def walk(node, points, weight, names, entrance, seen):
+        edges = out_edges[node]
+        if not edges:
+            routes.append(Route("-".join(names), points, weight, entrance))
+            return
+        split_total = sum(e.get("weight", 1.0) for e in edges)
+        for e in edges:
+            nxt = e["to"]
+            if nxt in seen:
+                raise ValueError(f"pathGraph has a cycle through '{nxt}'")
+            seg = [scaled(p) for p in e.get("via", [])] + [scaled(nodes[nxt])]
+            walk(nxt, points + seg, weight * e.get("weight", 1.0) / split_total,
+                 names + [nxt], entrance, seen | {nxt})
+
+    for entrance, weight in graph["entrances"].items():
+        walk(entrance, [scaled(nodes[entrance])], weight, [entrance], entrance, {entrance})
+
+    # Parallel edges between the same nodes would give routes the same name
+    seen_names = {}
+    for route in routes:
+        n = seen_names.get(route.name, 0)
+        seen_names[route.name] = n + 1
+        if n:
+            route.name = f"{route.name}#{n}"
+
+    return RouteTable(routes)
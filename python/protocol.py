@@ -0,0 +1,171 @@
+"""
+protocol.py
+
+Binary wire format between the headless game server and its clients.
+
+Every message is a frame: uint32 length + payload. Payload byte 0 is the
+message type.
+
+  Client -> server
+    MSG_COMMAND   '<BBhhh'  type, command code, a, b, c   (see commands.py)
+
+  Server -> clients
+    MSG_KEYFRAME  full state, sent once when a client joins
+    MSG_DELTA     only what changed since the previous tick
+
+Keyframes and deltas share one layout: a fixed header followed by sections,
+each a uint32 count plus a packed NumPy record array (so encoding and decoding
+is one tobytes()/frombuffer() per section, not per entity). Positions are
+fixed point (1/QUANT px) int16.
+"""
+import struct
+
+import numpy as np
+
+MSG_COMMAND = 1
+MSG_KEYFRAME = 2
+MSG_DELTA = 3
+
+QUANT = 4
+
+FRAME = struct.Struct("<I")
+COMMAND = struct.Struct("<BBhhh")
+# type, tick, gold, lives, wave index, flags, speed index
+HEADER = struct.Struct("<BIiHHBB")
+COUNT = struct.Struct("<I")
+
+FLAG_PAUSED = 1
+FLAG_WAVE_ACTIVE = 2
+FLAG_FIRST_START = 4
+
+SECTIONS = (
+    ("spawned", np.dtype([("id", "<u4"), ("type", "u1"), ("x", "<i2"), ("y", "<i2"),
+                          ("hp", "<f4"), ("baseHp", "<f4"), ("speed", "<f4")])),
+    ("moved", np.dtype([("id", "<u4"), ("x", "<i2"), ("y", "<i2")])),
+    ("hp", np.dtype([("id", "<u4"), ("hp", "<f4")])),
+    ("removed", np.dtype([("id", "<u4")])),
+    ("projectiles", np.dtype([("id", "<u4"), ("x", "<i2"), ("y", "<i2"),
+                              ("targetX", "<i2"), ("targetY", "<i2"), ("speed", "<f4")])),
+    ("projectilesRemoved", np.dtype([("id", "<u4")])),
+    ("towers", np.dtype([("id", "<u2"), ("spot", "<u2"), ("typeId", "<u2"), ("level", "u1")])),
+    ("fighters", np.dtype([("slot", "<u2"), ("x", "<i2"), ("y", "<i2"),
+                           ("hp", "<f4"), ("maxHp", "<f4"), ("dead", "u1")])),
+)
+
+def q(v):
+    return int(round(v * QUANT))
+
+# ---------------------------------------
+# Framing
+# ---------------------------------------
+def frame(payload):
+    return FRAME.pack(len(payload)) + payload
+
+def encode_command(code, a=0, b=0, c=0):
+    return frame(COMMAND.pack(MSG_COMMAND, code, a, b, c))
+
+def decode_command(payload):
+    _, code, a, b, c = COMMAND.unpack(payload)
+    return code, a, b, c
+
+# ---------------------------------------
+# State messages
+# ---------------------------------------
+def encode_state(msg_type, tick, game, sections):
+    flags = ((FLAG_PAUSED if game.paused else 0) |
+             (FLAG_WAVE_ACTIVE if game.wave_manager.wave_active else 0) |
+             (FLAG_FIRST_START if game.is_first_start else 0))
+    parts = [HEADER.pack(msg_type, tick, int(game.gold), max(0, game.lives),
+                         game.wave_manager.wave_index, flags, game.speedIndex)]
+    for name, dtype in SECTIONS:
+        rows = sections.get(name, ())
+        arr = np.array(rows, dtype=dtype) if len(rows) else np.zeros(0, dtype=dtype)
+        parts.append(COUNT.pack(len(arr)))
+        parts.append(arr.tobytes())
+    return frame(b"".join(parts))
+
+def decode_state(payload):
+    msg_type, tick, gold, lives, wave, flags, speed_index = HEADER.unpack_from(payload, 0)
+    msg = {
+        "type": msg_type, "tick": tick, "gold": gold, "lives": lives, "wave": wave,
+        "paused": bool(flags & FLAG_PAUSED),
+        "waveActive": bool(flags & FLAG_WAVE_ACTIVE),
+        "firstStart": bool(flags & FLAG_FIRST_START),
+        "speedIndex": speed_index,
+    }
+    offset = HEADER.size
+    for name, dtype in SECTIONS:
+        (count,) = COUNT.unpack_from(payload, offset)
+        offset += COUNT.size
+        msg[name] = np.frombuffer(payload, dtype=dtype, count=count, offset=offset)
+        offset += count * dtype.itemsize
+    return msg
+
+class StateTracker:
+    """
+    Remembers what clients were last told (quantized) so each tick only the
+    differences are encoded. A fresh tracker diffs against "nothing", which is
+    exactly a keyframe.
+    """
+    def __init__(self):
+        self.enemies = {}      # id -> (qx, qy, hp)
+        self.projectiles = set()
+        self.towers = {}       # id -> level
+        self.fighters = {}     # slot -> (qx, qy, hp, maxHp, dead)
+
+    def diff(self, game):
+        type_codes = {name: i for i, name in enumerate(game.enemy_manager.enemy_base_data)}
+        spawned, moved, hp_changed = [], [], []
+        seen = {}
+        for e in game.enemies:
+            eid = e["id"]
+            qx, qy = q(e["x"]), q(e["y"])
+            hp = float(np.float32(e["hp"]))
+            seen[eid] = (qx, qy, hp)
+            prev = self.enemies.get(eid)
+            if prev is None:
+                spawned.append((eid, type_codes.get(e["name"], 0), qx, qy, hp, e["baseHp"], e["speed"]))
+                continue
+            if prev[0] != qx or prev[1] != qy:
+                moved.append((eid, qx, qy))
+            if prev[2] != hp:
+                hp_changed.append((eid, hp))
+        removed = [(eid,) for eid in self.enemies.keys() - seen.keys()]
+        self.enemies = seen
+
+        new_projectiles = []
+        current = set()
+        for p in game.tower_manager.projectiles:
+            current.add(p["id"])
+            if p["id"] not in self.projectiles:
+                new_projectiles.append((p["id"], q(p["x"]), q(p["y"]),
+                                        q(p["targetX"]), q(p["targetY"]), p["speed"]))
+        projectiles_removed = [(pid,) for pid in self.projectiles - current]
+        self.projectiles = current
+
+        towers = []
+        for t in game.tower_manager.towers:
+            if self.towers.get(t["id"]) != t["level"]:
+                towers.append((t["id"], t["spot"]["index"], t["typeId"], t["level"]))
+                self.towers[t["id"]] = t["level"]
+
+        fighters = []
+        combat = game.combat
+        n = combat.count
+        if n:
+            qx = np.rint(combat.x[:n] * QUANT).astype(int).tolist()
+            qy = np.rint(combat.y[:n] * QUANT).astype(int).tolist()
+            hp = combat.hp[:n].astype(np.float32).tolist()
+            max_hp = combat.max_hp[:n].astype(np.float32).tolist()
+            dead = combat.dead[:n].tolist()
+            for slot in range(n):
+                state = (qx[slot], qy[slot], hp[slot], max_hp[slot], dead[slot])
+                if self.fighters.get(slot) != state:
+                    fighters.append((slot,) + state)
+                    self.fighters[slot] = state
+
+        return {
+            "spawned": spawned, "moved": moved, "hp": hp_changed, "removed": removed,
+            "projectiles": new_projectiles, "projectilesRemoved": projectiles_removed,
+            "towers": towers, "fighters": fighters,
+        }
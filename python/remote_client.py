@@ -0,0 +1,175 @@
+import queue
+import socket
+import threading
+
+import protocol
+from protocol import QUANT
+
+# ---------------------------------------
+# Mirror helpers (shared with split_mode.py)
+# ---------------------------------------
+def mirror_enemy(game, enemy_id, type_code, x, y, hp, base_hp, speed):
+    """Build a draw-only enemy dict in a mirror game; it never moves on its own."""
+    em = game.enemy_manager
+    name = list(em.enemy_base_data)[type_code]
+    img = em.loaded_enemy_assets[name]
+    enemy = {
+        "id": enemy_id,
+        "name": name,
+        "image": img,
+        "width": img.get_width(),
+        "height": img.get_height(),
+        "x": x,
+        "y": y,
+        "hp": hp,
+        "baseHp": base_hp,
+        "speed": speed,
+        "gold": em.enemy_base_data[name]["gold"],
+        "dead": False,
+    }
+    game.effects.attach(enemy, game.batch_index)
+    return enemy
+
+def mirror_tower(game, spot_index, type_id, level):
+    """Make the mirror's tower on `spot_index` match; builds it on first sight."""
+    tm = game.tower_manager
+    tower = tm.towers_by_spot.get(spot_index)
+    if tower is None:
+        spot = game.tower_spots[spot_index]
+        spot["occupied"] = True
+        tower = tm.create_tower(tm.registry.type_names[type_id], spot["x"], spot["y"], spot)
+    if tower["level"] != level:
+        tower["level"] = level
+        if tm.registry.kind[tower["typeId"]] == "barracks":
+            game.unit_manager.apply_level(tower)
+    return tower
+
+class RemoteClient:
+    """
+    Thin-renderer side of server.py. A background thread reads frames off the
+    socket; the pygame loop calls `apply_pending()` once per frame to fold
+    them into a local mirror Game, which is only ever drawn, never updated.
+    Clicks still go through the mirror's UIManager, but its command_sink
+    sends them to the server instead of applying them.
+    """
+    def __init__(self, host, port):
+        self.sock = socket.create_connection((host, port))
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.inbox = queue.Queue()
+        self.connected = True
+        self.enemies_by_id = {}
+        self.projectiles_by_id = {}
+        self.thread = threading.Thread(target=self.read_loop, name="remote-client", daemon=True)
+        self.thread.start()
+
+    def read_loop(self):
+        f = self.sock.makefile("rb")
+        try:
+            while True:
+                header = f.read(protocol.FRAME.size)
+                if len(header) < protocol.FRAME.size:
+                    break
+                (length,) = protocol.FRAME.unpack(header)
+                payload = f.read(length)
+                if len(payload) < length:
+                    break
+                self.inbox.put(payload)
+        except OSError:
+            pass
+        self.connected = False
+
+    def send(self, code, a=0, b=0, c=0):
+        try:
+            self.sock.sendall(protocol.encode_command(code, a, b, c))
+        except OSError:
+            self.connected = False
+
+    def close(self):
+        self.sock.close()
+
+    def attach(self, game):
+        game.ui_manager.command_sink = self.send
+
+    def apply_pending(self, game, delta_sec):
+        while True:
+            try:
+                payload = self.inbox.get_nowait()
+            except queue.Empty:
+                break
+            self.apply_state(game, protocol.decode_state(payload))
+
+        # Projectiles fly in straight lines, so extrapolate between messages
+        for proj in game.tower_manager.projectiles:
+            game.tower_manager.update_projectile(proj, delta_sec)
+
+    def apply_state(self, game, msg):
+        if msg["type"] == protocol.MSG_KEYFRAME:
+            for enemy in self.enemies_by_id.values():
+                game.effects.release(enemy)
+            self.enemies_by_id.clear()
+            self.projectiles_by_id.clear()
+
+        game.gold = msg["gold"]
+        game.lives = msg["lives"]
+        game.paused = msg["paused"]
+        game.is_first_start = msg["firstStart"]
+        game.speedIndex = msg["speedIndex"]
+        game.gameSpeed = game.speedOptions[game.speedIndex]
+        game.wave_manager.wave_index = msg["wave"]
+        game.wave_manager.wave_active = msg["waveActive"]
+
+        # Enemies
+        for row in msg["spawned"]:
+            enemy = mirror_enemy(game, int(row["id"]), int(row["type"]), row["x"] / QUANT, row["y"] / QUANT,
+                                 float(row["hp"]), float(row["baseHp"]), float(row["speed"]))
+            self.enemies_by_id[enemy["id"]] = enemy
+        for row in msg["moved"]:
+            enemy = self.enemies_by_id.get(int(row["id"]))
+            if enemy:
+                enemy["x"] = row["x"] / QUANT
+                enemy["y"] = row["y"] / QUANT
+        for row in msg["hp"]:
+            enemy = self.enemies_by_id.get(int(row["id"]))
+            if enemy:
+                enemy["hp"] = float(row["hp"])
+        for row in msg["removed"]:
+            enemy = self.enemies_by_id.pop(int(row["id"]), None)
+            if enemy:
+                enemy["dead"] = True
+                game.effects.release(enemy)
+        game.enemies = list(self.enemies_by_id.values())
+        game.enemy_grid.rebuild(game.enemies)
+
+        # Projectiles
+        for row in msg["projectiles"]:
+            self.projectiles_by_id[int(row["id"])] = {
+                "id": int(row["id"]),
+                "x": row["x"] / QUANT,
+                "y": row["y"] / QUANT,
+                "targetX": row["targetX"] / QUANT,
+                "targetY": row["targetY"] / QUANT,
+                "speed": float(row["speed"]),
+                "hit": False,
+                "w": 4,
+                "h": 4,
+            }
+        for row in msg["projectilesRemoved"]:
+            self.projectiles_by_id.pop(int(row["id"]), None)
+        game.tower_manager.projectiles = list(self.projectiles_by_id.values())
+
+        # Towers (build order matches the server's, so barracks soldiers land
+        # in the same fighter slots)
+        for row in msg["towers"]:
+            mirror_tower(game, int(row["spot"]), int(row["typeId"]), int(row["level"]))
+
+        # Soldiers and heroes
+        combat = game.combat
+        for row in msg["fighters"]:
+            slot = int(row["slot"])
+            if slot >= combat.count:
+                continue
+            combat.x[slot] = row["x"] / QUANT
+            combat.y[slot] = row["y"] / QUANT
+            combat.hp[slot] = row["hp"]
+            combat.max_hp[slot] = row["maxHp"]
+            combat.dead[slot] = bool(row["dead"])
@@ -0,0 +1,110 @@
+"""
+server.py
+
+Runs the Game simulation headless under asyncio as the single source of
+truth. Clients connect over TCP, send commands (see commands.py) and receive
+one keyframe followed by a per-tick delta stream (see protocol.py). Every
+client gets the same encoded bytes, so adding spectators costs a socket
+write, not another simulation.
+
+    python server.py --port 7777
+    python main.py --connect 127.0.0.1:7777
+"""
+import argparse
+import asyncio
+import struct
+import time
+
+import commands
+import protocol
+from game import Game
+
+class GameServer:
+    def __init__(self, width=800, height=600, tick_rate=60, max_buffer=1 << 20):
+        self.game = Game(width, height)
+        self.tick_dt = 1.0 / tick_rate
+        self.tick = 0
+        self.tracker = protocol.StateTracker()
+        self.clients = set()
+        self.joining = set()
+        self.command_queue = asyncio.Queue()
+        self.unknown_commands = 0  # commands with a code apply_command doesn't know
+        # A spectator whose socket backs up past this many bytes is dropped
+        # instead of letting its queue grow without bound.
+        self.max_buffer = max_buffer
+
+    async def handle_client(self, reader, writer):
+        self.joining.add(writer)
+        try:
+            while True:
+                header = await reader.readexactly(protocol.FRAME.size)
+                (length,) = protocol.FRAME.unpack(header)
+                # Clients only ever send commands; anything else is a broken
+                # or hostile peer, and must not make us allocate `length` bytes
+                if length != protocol.COMMAND.size:
+                    print("Dropping client sending a bad frame", writer.get_extra_info("peername"))
+                    break
+                payload = await reader.readexactly(length)
+                if payload[0] == protocol.MSG_COMMAND:
+                    await self.command_queue.put(protocol.decode_command(payload))
+        except (asyncio.IncompleteReadError, ConnectionError, struct.error):
+            pass
+        finally:
+            self.joining.discard(writer)
+            self.clients.discard(writer)
+            writer.close()
+
+    def broadcast(self, data, targets):
+        for writer in list(targets):
+            if writer.transport.get_write_buffer_size() > self.max_buffer:
+                print("Dropping slow client", writer.get_extra_info("peername"))
+                targets.discard(writer)
+                writer.close()
+                continue
+            writer.write(data)
+
+    def step(self):
+        # Commands only ever touch the game between ticks
+        while not self.command_queue.empty():
+            if not commands.apply_command(self.game, *self.command_queue.get_nowait()):
+                self.unknown_commands += 1
+
+        self.game.update(self.tick_dt)
+        self.tick += 1
+
+        delta = self.tracker.diff(self.game)
+        if self.clients:
+            self.broadcast(protocol.encode_state(protocol.MSG_DELTA, self.tick, self.game, delta), self.clients)
+
+        if self.joining:
+            # Newcomers get everything as of this tick, then ride the shared deltas
+            keyframe = protocol.StateTracker().diff(self.game)
+            self.broadcast(protocol.encode_state(protocol.MSG_KEYFRAME, self.tick, self.game, keyframe), self.joining)
+            self.clients |= self.joining
+            self.joining.clear()
+
+    async def run(self, host, port):
+        server = await asyncio.start_server(self.handle_client, host, port)
+        print("Serving on", ", ".join(str(s.getsockname()) for s in server.sockets))
+        async with server:
+            next_tick = time.perf_counter()
+            while True:
+                self.step()
+                next_tick += self.tick_dt
+                await asyncio.sleep(max(0.0, next_tick - time.perf_counter()))
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless authoritative game server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument("--tick-rate", type=int, default=60)
+    args = parser.parse_args()
+
+    server = GameServer(tick_rate=args.tick_rate)
+    try:
+        asyncio.run(server.run(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
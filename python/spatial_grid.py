@@ -0,0 +1,63 @@
+class SpatialGrid:
+    """
+    Uniform grid bucketing items by cell. The enemy grid is rebuilt once per
+    tick by EnemyManager and shared by anything that needs "who is near here?"
+    (tower targeting, tower wake-ups, click hit-testing).
+    """
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def cell_of(self, x, y):
+        return (int(x // self.cell_size), int(y // self.cell_size))
+
+    def cells_in_rect(self, left, top, right, bottom):
+        cx0, cy0 = self.cell_of(left, top)
+        cx1, cy1 = self.cell_of(right, bottom)
+        return [(cx, cy) for cx in range(cx0, cx1 + 1) for cy in range(cy0, cy1 + 1)]
+
+    def cells_in_radius(self, x, y, radius):
+        return self.cells_in_rect(x - radius, y - radius, x + radius, y + radius)
+
+    def clear(self):
+        self.cells.clear()
+
+    def insert(self, x, y, item):
+        self.cells.setdefault(self.cell_of(x, y), []).append(item)
+
+    def insert_rect(self, left, top, right, bottom, item):
+        """Register an item with an extent in every cell its rect overlaps."""
+        for cell in self.cells_in_rect(left, top, right, bottom):
+            self.cells.setdefault(cell, []).append(item)
+
+    def at_point(self, x, y):
+        """Everything bucketed in the single cell containing (x, y)."""
+        return self.cells.get(self.cell_of(x, y), ())
+
+    def rebuild(self, items):
+        """Re-bucket items (dicts with "x"/"y") from scratch."""
+        self.cells.clear()
+        for item in items:
+            self.insert(item["x"], item["y"], item)
+
+    def occupied_cells(self):
+        return self.cells.keys()
+
+    def query_rect(self, left, top, right, bottom):
+        found = []
+        for cell in self.cells_in_rect(left, top, right, bottom):
+            bucket = self.cells.get(cell)
+            if bucket:
+                found.extend(bucket)
+        return found
+
+    def query_radius(self, x, y, radius):
+        """Items whose position lies within `radius` of (x, y)."""
+        r2 = radius * radius
+        found = []
+        for item in self.query_rect(x - radius, y - radius, x + radius, y + radius):
+            dx = item["x"] - x
+            dy = item["y"] - y
+            if dx*dx + dy*dy <= r2:
+                found.append(item)
+        return found
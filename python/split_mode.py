@@ -0,0 +1,322 @@
+"""
+split_mode.py
+
+Runs the simulation in its own process so a slow draw never stalls an
+update and the reverse.
+
+    python main.py --split
+
+The simulation process owns the real Game. After every tick it publishes
+its entity state into a shared-memory block that holds two snapshot
+buffers. Each buffer has its own sequence counter, which is odd while the
+buffer is being written, and a header index names the newest complete one.
+The writer always fills the buffer that is not active and flips the index
+only when it is done. Clicks travel back as commands.py tuples over a
+multiprocessing queue.
+
+The renderer does not fold the shared buffer in place. It copies the used
+rows of the active buffer out (read_snapshot), checks that buffer's
+counter has not moved, and only then folds the copy into a local mirror
+Game (the same way remote_client.py does) and interpolates enemy positions
+between snapshots. A copy the writer raced is dropped and the next frame
+tries again. This is a deliberate departure from a zero-copy read: once
+the renderer falls a buffer behind, the writer reuses the buffer it is
+reading, and folding that in place could mix two ticks into the mirror.
+The copy is only the live rows, not the whole block, and costs about
+10-40 us a frame for 50-500 enemies.
+"""
+import multiprocessing as mp
+import queue
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+import commands
+from maps.level1 import LEVEL1_DATA
+from protocol import FLAG_PAUSED, FLAG_WAVE_ACTIVE, FLAG_FIRST_START
+from remote_client import mirror_enemy, mirror_tower
+
+HEADER = np.dtype([("active", "<i8"), ("seq", "<i8", (2,))])
+ENEMY = np.dtype([("id", "<u4"), ("type", "u1"), ("x", "<f4"), ("y", "<f4"),
+                  ("hp", "<f4"), ("baseHp", "<f4"), ("speed", "<f4")])
+PROJECTILE = np.dtype([("id", "<u4"), ("x", "<f4"), ("y", "<f4"),
+                       ("targetX", "<f4"), ("targetY", "<f4"), ("speed", "<f4")])
+FIGHTER = np.dtype([("x", "<f4"), ("y", "<f4"), ("hp", "<f4"), ("maxHp", "<f4"), ("dead", "u1")])
+TOWER = np.dtype([("typeId", "<i2"), ("level", "u1")])  # typeId -1 = empty spot
+
+def snapshot_dtype(max_enemies, max_projectiles, max_fighters, num_spots):
+    return np.dtype([
+        ("tick", "<u8"),
+        ("gold", "<i4"), ("lives", "<i4"), ("wave", "<i4"),
+        ("flags", "u1"), ("speedIndex", "u1"),
+        ("enemyCount", "<u4"), ("enemies", ENEMY, (max_enemies,)),
+        ("projectileCount", "<u4"), ("projectiles", PROJECTILE, (max_projectiles,)),
+        ("fighterCount", "<u4"), ("fighters", FIGHTER, (max_fighters,)),
+        ("towers", TOWER, (num_spots,)),
+    ], align=True)
+
+class SharedState:
+    """NumPy views over the header and both snapshot buffers of one shared-memory block."""
+    def __init__(self, shm, snap_dtype):
+        self.shm = shm
+        self.header = np.ndarray((), dtype=HEADER, buffer=shm.buf)
+        buffers = np.ndarray((2,), dtype=snap_dtype, buffer=shm.buf, offset=HEADER.itemsize)
+        self.buffers = [buffers[i:i + 1].reshape(()) for i in range(2)]
+
+    @staticmethod
+    def size(snap_dtype):
+        return HEADER.itemsize + 2 * snap_dtype.itemsize
+
+    def release(self):
+        # Views must go before the mapping can close
+        self.header = None
+        self.buffers = None
+        self.shm.close()
+
+# ---------------------------------------
+# Simulation process
+# ---------------------------------------
+def publish(shared, game, tick):
+    seq = shared.header["seq"]
+    b = 1 - int(shared.header["active"])
+    seq[b] += 1  # odd: being written
+    snap = shared.buffers[b]
+
+    snap["tick"] = tick
+    snap["gold"] = int(game.gold)
+    snap["lives"] = game.lives
+    snap["wave"] = game.wave_manager.wave_index
+    snap["flags"] = ((FLAG_PAUSED if game.paused else 0) |
+                     (FLAG_WAVE_ACTIVE if game.wave_manager.wave_active else 0) |
+                     (FLAG_FIRST_START if game.is_first_start else 0))
+    snap["speedIndex"] = game.speedIndex
+
+    # Past capacity only the oldest entities are shown
+    type_codes = {name: i for i, name in enumerate(game.enemy_manager.enemy_base_data)}
+    enemies = game.enemies[:len(snap["enemies"])]
+    snap["enemyCount"] = len(enemies)
+    if enemies:
+        snap["enemies"][:len(enemies)] = [
+            (e["id"], type_codes.get(e["name"], 0), e["x"], e["y"], e["hp"], e["baseHp"], e["speed"])
+            for e in enemies
+        ]
+
+    projectiles = game.tower_manager.projectiles[:len(snap["projectiles"])]
+    snap["projectileCount"] = len(projectiles)
+    if projectiles:
+        snap["projectiles"][:len(projectiles)] = [
+            (p["id"], p["x"], p["y"], p["targetX"], p["targetY"], p["speed"]) for p in projectiles
+        ]
+
+    combat = game.combat
+    n = min(combat.count, len(snap["fighters"]))
+    snap["fighterCount"] = n
+    fighters = snap["fighters"]
+    fighters["x"][:n] = combat.x[:n]
+    fighters["y"][:n] = combat.y[:n]
+    fighters["hp"][:n] = combat.hp[:n]
+    fighters["maxHp"][:n] = combat.max_hp[:n]
+    fighters["dead"][:n] = combat.dead[:n]
+
+    towers = snap["towers"]
+    towers["typeId"] = -1
+    towers["level"] = 0
+    for spot_index, tower in game.tower_manager.towers_by_spot.items():
+        towers[spot_index] = (tower["typeId"], tower["level"])
+
+    seq[b] += 1  # even: complete
+    shared.header["active"] = b
+
+def run_simulation(shm_name, snap_dtype, command_queue, stop_event, width, height, level_data, tick_rate):
+    from game import Game
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    shared = SharedState(shm, snap_dtype)
+    game = Game(width, height, level_data)
+    tick_dt = 1.0 / tick_rate
+    tick = 0
+    next_tick = time.perf_counter()
+    try:
+        while not stop_event.is_set():
+            # Commands only ever touch the game between ticks
+            while True:
+                try:
+                    commands.apply_command(game, *command_queue.get_nowait())
+                except queue.Empty:
+                    break
+            game.update(tick_dt)
+            tick += 1
+            publish(shared, game, tick)
+
+            next_tick += tick_dt
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_tick = time.perf_counter()  # fell behind; don't try to catch up in a burst
+    finally:
+        shared.release()
+
+# ---------------------------------------
+# Renderer side
+# ---------------------------------------
+def read_snapshot(snap):
+    """
+    Copy the used part of a snapshot buffer out of shared memory. Nothing
+    here touches the mirror, so a copy the writer raced can be thrown away.
+    """
+    enemy_count = min(int(snap["enemyCount"]), len(snap["enemies"]))
+    projectile_count = min(int(snap["projectileCount"]), len(snap["projectiles"]))
+    fighter_count = min(int(snap["fighterCount"]), len(snap["fighters"]))
+    return {
+        "tick": int(snap["tick"]),
+        "gold": int(snap["gold"]),
+        "lives": int(snap["lives"]),
+        "wave": int(snap["wave"]),
+        "flags": int(snap["flags"]),
+        "speedIndex": int(snap["speedIndex"]),
+        "enemies": snap["enemies"][:enemy_count].copy(),
+        "projectiles": snap["projectiles"][:projectile_count].tolist(),
+        "fighters": snap["fighters"][:fighter_count].copy(),
+        "towers": snap["towers"].tolist(),
+    }
+
+class SplitSimulation:
+    """
+    Starts the simulation process and keeps a local mirror Game in sync with
+    it. Drop-in for RemoteClient in main.py: attach(game), then
+    apply_pending(game, delta_sec) once per frame, close() on exit.
+    """
+    def __init__(self, width=800, height=600, level_data=LEVEL1_DATA, tick_rate=60,
+                 max_enemies=4096, max_projectiles=4096, max_fighters=256):
+        self.snap_dtype = snapshot_dtype(max_enemies, max_projectiles, max_fighters,
+                                         len(level_data["towerSpots"]))
+        self.tick_dt = 1.0 / tick_rate
+        self.shm = shared_memory.SharedMemory(create=True, size=SharedState.size(self.snap_dtype))
+        self.shared = SharedState(self.shm, self.snap_dtype)
+        self.shared.header["active"] = 0
+        self.shared.header["seq"] = 0
+
+        # spawn, not fork: the parent already has an SDL window open
+        ctx = mp.get_context("spawn")
+        self.command_queue = ctx.Queue()
+        self.stop_event = ctx.Event()
+        self.process = ctx.Process(
+            target=run_simulation, name="simulation", daemon=True,
+            args=(self.shm.name, self.snap_dtype, self.command_queue, self.stop_event,
+                  width, height, level_data, tick_rate),
+        )
+        self.process.start()
+
+        self.last_tick = 0
+        self.since_snapshot = 0.0
+        self.enemies_by_id = {}
+        self.ids = np.zeros(0, dtype=np.int64)
+        self.from_xy = np.zeros((0, 2))
+        self.to_xy = np.zeros((0, 2))
+
+    @property
+    def connected(self):
+        return self.process.is_alive()
+
+    def send(self, code, a=0, b=0, c=0):
+        self.command_queue.put((code, a, b, c))
+
+    def attach(self, game):
+        game.ui_manager.command_sink = self.send
+
+    def close(self):
+        self.stop_event.set()
+        self.process.join(timeout=2.0)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.shared.release()
+        self.shm.unlink()
+
+    def apply_pending(self, game, delta_sec):
+        header = self.shared.header
+        b = int(header["active"])
+        seq = int(header["seq"][b])
+        snap = self.shared.buffers[b]
+        state = None
+        if seq % 2 == 0 and int(snap["tick"]) > self.last_tick:
+            state = read_snapshot(snap)
+            # The writer only reuses this buffer after publishing the other
+            # one, so an unchanged counter means the copy is not torn. A torn
+            # copy is dropped and the next frame tries again.
+            if int(header["seq"][b]) != seq:
+                state = None
+        if state is not None:
+            self.apply_snapshot(game, state)
+            self.last_tick = state["tick"]
+            self.since_snapshot = 0.0
+        else:
+            self.since_snapshot += delta_sec
+
+        # Enemies glide from where they were drawn to the newest snapshot over one tick
+        if len(self.ids):
+            alpha = min(1.0, self.since_snapshot / self.tick_dt)
+            xy = (self.from_xy + (self.to_xy - self.from_xy) * alpha).tolist()
+            for enemy, (x, y) in zip(game.enemies, xy):
+                enemy["x"] = x
+                enemy["y"] = y
+
+        for proj in game.tower_manager.projectiles:
+            game.tower_manager.update_projectile(proj, delta_sec)
+
+    def apply_snapshot(self, game, state):
+        game.gold = state["gold"]
+        game.lives = state["lives"]
+        flags = state["flags"]
+        game.paused = bool(flags & FLAG_PAUSED)
+        game.is_first_start = bool(flags & FLAG_FIRST_START)
+        game.speedIndex = state["speedIndex"]
+        game.gameSpeed = game.speedOptions[game.speedIndex]
+        game.wave_manager.wave_index = state["wave"]
+        game.wave_manager.wave_active = bool(flags & FLAG_WAVE_ACTIVE)
+
+        # Enemies, reconciled by id
+        rows = state["enemies"]
+        ids = rows["id"].astype(np.int64)
+        to_xy = np.column_stack((rows["x"], rows["y"])).astype(np.float64)
+        from_xy = to_xy.copy()
+        current = {}
+        for i, (eid, type_code, hp, base_hp, speed) in enumerate(zip(
+                ids.tolist(), rows["type"].tolist(), rows["hp"].tolist(),
+                rows["baseHp"].tolist(), rows["speed"].tolist())):
+            enemy = self.enemies_by_id.pop(eid, None)
+            if enemy is None:
+                enemy = mirror_enemy(game, eid, type_code, to_xy[i, 0], to_xy[i, 1], hp, base_hp, speed)
+            else:
+                from_xy[i] = (enemy["x"], enemy["y"])
+                enemy["hp"] = hp
+            current[eid] = enemy
+        for enemy in self.enemies_by_id.values():
+            enemy["dead"] = True
+            game.effects.release(enemy)
+        self.enemies_by_id = current
+        self.ids, self.from_xy, self.to_xy = ids, from_xy, to_xy
+        game.enemies = list(current.values())
+        game.enemy_grid.rebuild(game.enemies)
+
+        # Projectiles are rebuilt wholesale and extrapolated between snapshots
+        game.tower_manager.projectiles = [
+            {"id": pid, "x": x, "y": y, "targetX": tx, "targetY": ty,
+             "speed": speed, "hit": False, "w": 4, "h": 4}
+            for pid, x, y, tx, ty, speed in state["projectiles"]
+        ]
+
+        # Towers first, so barracks soldiers exist before their slots are written
+        for spot_index, (type_id, level) in enumerate(state["towers"]):
+            if type_id >= 0 and level >= 1:
+                mirror_tower(game, spot_index, type_id, level)
+
+        combat = game.combat
+        fighters = state["fighters"]
+        n = min(len(fighters), combat.count)
+        combat.x[:n] = fighters["x"][:n]
+        combat.y[:n] = fighters["y"][:n]
+        combat.hp[:n] = fighters["hp"][:n]
+        combat.max_hp[:n] = fighters["maxHp"][:n]
+        combat.dead[:n] = fighters["dead"][:n].astype(bool)
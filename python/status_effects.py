@@ -0,0 +1,210 @@
+import numpy as np
+
+# The rules live in these two functions, on slot `s` of anything that holds
+# StatusEffectEngine.FIELDS as indexable attributes: the engine's arrays, or
+# difficulty_estimator's per-enemy lists.
+
+def apply_effect(fx, s, effect):
+    """Apply one effect hit to slot `s`. Returns False when a weaker slow was ignored."""
+    kind = effect["kind"]
+    amount = effect.get("amount", 0.0)
+    duration = effect.get("duration", 1.0)
+
+    if kind == "slow":
+        if fx.slow_time[s] <= 0 or amount >= fx.slow_amount[s]:
+            fx.slow_amount[s] = amount
+            fx.slow_time[s] = duration
+            fx.speed_mult[s] = 1.0 - amount
+        else:
+            return False
+    elif kind == "burn":
+        if fx.burn_time[s] <= 0 or amount >= fx.burn_dps[s]:
+            fx.burn_dps[s] = amount
+        fx.burn_time[s] = max(fx.burn_time[s], duration)
+    elif kind == "poison":
+        fx.poison_dps[s] = amount
+        fx.poison_stacks[s] = min(fx.poison_stacks[s] + 1, effect.get("maxStacks", 5))
+        fx.poison_time[s] = duration
+    elif kind == "shred":
+        fx.shred_amount[s] = amount
+        fx.shred_stacks[s] = min(fx.shred_stacks[s] + 1, effect.get("maxStacks", 5))
+        fx.shred_time[s] = duration
+        fx.damage_mult[s] = 1.0 + fx.shred_amount[s] * fx.shred_stacks[s]
+    return True
+
+def settle(fx, s, delta_sec):
+    """
+    Run slot `s` forward `delta_sec` in one go and return the damage over time
+    it took. The same as StatusEffectEngine.step, except that the span is split
+    where effects run out instead of being rounded to a tick.
+    """
+    slow_time, burn_time = fx.slow_time[s], fx.burn_time[s]
+    poison_time, shred_time = fx.poison_time[s], fx.shred_time[s]
+    if slow_time <= 0 and burn_time <= 0 and poison_time <= 0 and shred_time <= 0:
+        return 0.0  # nothing running, and anything that ran out was expired then
+    dot = 0.0
+    if burn_time > 0 or poison_time > 0:
+        a = 0.0
+        for b in sorted(x for x in (burn_time, poison_time, shred_time) if 0 < x < delta_sec) + [delta_sec]:
+            rate = 0.0
+            if burn_time >= b:
+                rate += fx.burn_dps[s]
+            if poison_time >= b:
+                rate += fx.poison_dps[s] * fx.poison_stacks[s]
+            if shred_time >= b:
+                rate *= 1.0 + fx.shred_amount[s] * fx.shred_stacks[s]
+            dot += rate * (b - a)
+            a = b
+
+    if slow_time > 0:
+        fx.slow_time[s] = slow_time = slow_time - delta_sec
+    if burn_time > 0:
+        fx.burn_time[s] = burn_time = burn_time - delta_sec
+    if poison_time > 0:
+        fx.poison_time[s] = poison_time = poison_time - delta_sec
+    if shred_time > 0:
+        fx.shred_time[s] = shred_time = shred_time - delta_sec
+    if slow_time <= 0:
+        fx.slow_amount[s] = 0.0
+    if burn_time <= 0:
+        fx.burn_dps[s] = 0.0
+    if poison_time <= 0:
+        fx.poison_stacks[s] = 0
+    if shred_time <= 0:
+        fx.shred_stacks[s] = 0
+    fx.speed_mult[s] = 1.0 - fx.slow_amount[s]
+    fx.damage_mult[s] = 1.0 + fx.shred_amount[s] * fx.shred_stacks[s]
+    return dot
+
+class StatusEffectEngine:
+    """
+    Slow / burn / poison / armor-shred on enemies, stored as NumPy arrays
+    indexed by an effect slot (enemy["fxSlot"], handed out at spawn).
+
+    Stacking rules:
+      - slow:   strongest slow wins; re-applying at least as strong refreshes the timer
+      - burn:   doesn't stack; highest dps wins, timer refreshes
+      - poison: stacks (up to "maxStacks"); each application adds a stack and refreshes
+      - shred:  stacks (up to "maxStacks"); each stack adds "amount" extra damage taken
+
+    `step()` expires and applies everything in one pass per tick. Movement
+    reads `speed_mult`, and every hit goes through `damage_mult`. The
+    stacking rules themselves are `apply_effect()`, shared with
+    difficulty_estimator, and `settle()` is step() for one slot.
+
+    Like CombatEngine, one engine can hold the enemies of several games: each
+    slot records the owner index its game joined under, and `step()` takes
+    one delta per owner.
+    """
+    KINDS = ("slow", "burn", "poison", "shred")
+
+    FIELDS = (
+        "slow_amount", "slow_time",
+        "burn_dps", "burn_time",
+        "poison_dps", "poison_stacks", "poison_time",
+        "shred_amount", "shred_stacks", "shred_time",
+        "speed_mult", "damage_mult",
+    )
+
+    def __init__(self, capacity=64):
+        self.games = []            # owner index -> Game
+        self.capacity = 0
+        self.size = 0              # high-water mark of used slots
+        self.free_slots = []
+        self.enemy_of_slot = []
+        self.owner = np.zeros(0, dtype=np.int64)
+        for name in self.FIELDS:
+            setattr(self, name, np.zeros(0))
+        self.grow(capacity)
+
+    def grow(self, capacity):
+        extra = capacity - self.capacity
+        for name in self.FIELDS:
+            fill = 1.0 if name in ("speed_mult", "damage_mult") else 0.0
+            setattr(self, name, np.concatenate([getattr(self, name), np.full(extra, fill)]))
+        self.owner = np.concatenate([self.owner, np.zeros(extra, dtype=np.int64)])
+        self.enemy_of_slot.extend([None] * extra)
+        self.capacity = capacity
+
+    def add_game(self, game, owner=0):
+        """Seat `game` as `owner`, releasing the slots of the enemies the previous game there left behind."""
+        while len(self.games) <= owner:
+            self.games.append(None)
+        self.games[owner] = game
+        for slot in np.nonzero(self.owner[:self.size] == owner)[0].tolist():
+            enemy = self.enemy_of_slot[slot]
+            if enemy is not None:
+                self.release(enemy)
+
+    # ---------------------------------------
+    # Slot lifetime
+    # ---------------------------------------
+    def attach(self, enemy, owner=0):
+        if self.free_slots:
+            slot = self.free_slots.pop()
+        else:
+            if self.size == self.capacity:
+                self.grow(self.capacity * 2)
+            slot = self.size
+            self.size += 1
+        for name in self.FIELDS:
+            getattr(self, name)[slot] = 0.0
+        self.speed_mult[slot] = 1.0
+        self.damage_mult[slot] = 1.0
+        self.owner[slot] = owner
+        self.enemy_of_slot[slot] = enemy
+        enemy["fxSlot"] = slot
+
+    def release(self, enemy):
+        slot = enemy["fxSlot"]
+        self.enemy_of_slot[slot] = None
+        # Zero the timers so a freed slot never ticks damage
+        self.slow_time[slot] = self.burn_time[slot] = 0.0
+        self.poison_time[slot] = self.shred_time[slot] = 0.0
+        self.free_slots.append(slot)
+
+    # ---------------------------------------
+    # Applying effects
+    # ---------------------------------------
+    def apply(self, enemy, effect):
+        apply_effect(self, enemy["fxSlot"], effect)
+
+    # ---------------------------------------
+    # Per-tick pass
+    # ---------------------------------------
+    def step(self, delta_sec):
+        """Tick every slot; `delta_sec` is a scalar or one delta per owner."""
+        n = self.size
+        if n == 0:
+            return
+        if np.ndim(delta_sec):
+            delta_sec = np.asarray(delta_sec, dtype=float)[self.owner[:n]]
+
+        slow_time, burn_time = self.slow_time[:n], self.burn_time[:n]
+        poison_time, shred_time = self.poison_time[:n], self.shred_time[:n]
+
+        # settle() is this pass for one slot over any span; change them together.
+        # Damage over time is owed for the part of the tick the effect was still up
+        burn_dt = np.clip(burn_time, 0.0, delta_sec)
+        poison_dt = np.clip(poison_time, 0.0, delta_sec)
+        dot = (self.burn_dps[:n] * burn_dt +
+               self.poison_dps[:n] * self.poison_stacks[:n] * poison_dt)
+
+        for timer in (slow_time, burn_time, poison_time, shred_time):
+            np.subtract(timer, delta_sec, out=timer, where=timer > 0)
+
+        # Expire
+        self.slow_amount[:n][slow_time <= 0] = 0.0
+        self.burn_dps[:n][burn_time <= 0] = 0.0
+        self.poison_stacks[:n][poison_time <= 0] = 0.0
+        self.shred_stacks[:n][shred_time <= 0] = 0.0
+
+        # Derived multipliers that movement and damage read
+        self.speed_mult[:n] = 1.0 - self.slow_amount[:n]
+        self.damage_mult[:n] = 1.0 + self.shred_amount[:n] * self.shred_stacks[:n]
+        dot *= self.damage_mult[:n]
+
+        for slot in np.nonzero(dot)[0].tolist():
+            enemy = self.enemy_of_slot[slot]
+            if enemy is not None:
+                enemy["hp"] -= float(dot[slot])
@@ -0,0 +1,252 @@
+"""
+td_env.py
+
+Gym-style wrappers around Game for placement bots and other agents.
+
+    env = TowerDefenseEnv(seed=0)
+    obs, info = env.reset()
+    obs, reward, terminated, truncated, info = env.step(env.action_for_place(spot=2, type_id=0))
+
+    venv = VectorTowerDefenseEnv(64, seed=0)
+    obs, info = venv.reset()                  # every obs entry has a leading (64, ...) axis
+    obs, rewards, terminated, truncated, info = venv.step(actions)
+
+Actions are integers:
+    0                          do nothing
+    1                          send the next wave early
+    2 + spot * T + type_id     build `type_id` on `spot`   (T = number of tower types)
+    2 + S * T + spot           upgrade the tower on `spot` (S = number of spots)
+
+Observation (dict of NumPy arrays):
+    enemies      (max_enemies, 3) float32  x, y, hp of the oldest live enemies, zero-padded
+    enemy_count  ()               int32    live enemies (may exceed max_enemies)
+    tower_types  (S,)             int32    type id per spot, -1 when empty
+    tower_levels (S,)             int32    level per spot, 0 when empty
+    gold, lives, wave             ()       int32
+
+Reward per step: +1 per kill, -10 per leak, +5 per wave cleared.
+"""
+import numpy as np
+
+import commands
+from combat_engine import CombatEngine
+from event_bus import EventType
+from game import Game
+from maps.level1 import LEVEL1_DATA
+from status_effects import StatusEffectEngine
+
+class TowerDefenseEnv:
+    KILL_REWARD = 1.0
+    LEAK_PENALTY = -10.0
+    WAVE_REWARD = 5.0
+
+    def __init__(self, level_data=LEVEL1_DATA, seed=None, frame_skip=30, dt=1/60,
+                 max_enemies=64, max_steps=10000, width=800, height=600,
+                 combat=None, effects=None, batch_index=0):
+        self.level_data = level_data
+        self.seed = seed
+        self.frame_skip = frame_skip
+        self.dt = dt
+        self.max_enemies = max_enemies
+        self.max_steps = max_steps
+        self.width = width
+        self.height = height
+        # Shared engines when this env is one seat of a VectorTowerDefenseEnv
+        self.combat = combat
+        self.effects = effects
+        self.batch_index = batch_index
+        self.game = None
+        self.steps = 0
+        self.reset(seed)
+        self.seed = seed  # building the env doesn't use up its first episode
+
+        self.num_spots = len(self.game.tower_spots)
+        self.num_types = len(self.game.tower_manager.registry)
+        self.num_actions = 2 + self.num_spots * self.num_types + self.num_spots
+
+    # ---------------------------------------
+    # Action helpers
+    # ---------------------------------------
+    def action_for_place(self, spot, type_id):
+        return 2 + spot * self.num_types + type_id
+
+    def action_for_upgrade(self, spot):
+        return 2 + self.num_spots * self.num_types + spot
+
+    def decode_action(self, action):
+        """Map an action id to a commands.py (code, a, b) tuple, or None for a no-op."""
+        action = int(action)
+        if action == 0:
+            return None
+        if action == 1:
+            return (commands.SEND_WAVE, 0, 0)
+        action -= 2
+        placements = self.num_spots * self.num_types
+        if action < placements:
+            return (commands.PLACE, action // self.num_types, action % self.num_types)
+        return (commands.UPGRADE, action - placements, 0)
+
+    # ---------------------------------------
+    # Gym API
+    # ---------------------------------------
+    def reset(self, seed=None):
+        if seed is not None:
+            self.seed = seed
+        self.game = Game(self.width, self.height, self.level_data, seed=self.seed,
+                         combat=self.combat, effects=self.effects, batch_index=self.batch_index)
+        self.game.toggle_pause()  # first start -> running
+        self.game.event_bus.drain()
+        self.steps = 0
+        # Next reset of this env shouldn't replay the same episode
+        if self.seed is not None:
+            self.seed += 1
+        return self.observe(), {}
+
+    def step(self, action):
+        self.act(action)
+        for _ in range(self.frame_skip):
+            self.game.update(self.dt)
+            if self.finished():
+                break
+        reward, terminated, truncated = self.settle()
+        return self.observe(), reward, terminated, truncated, {}
+
+    def act(self, action):
+        cmd = self.decode_action(action)
+        if cmd is not None:
+            commands.apply_command(self.game, *cmd)
+
+    def settle(self):
+        """Close out a step once its frames have run: (reward, terminated, truncated)."""
+        self.steps += 1
+        reward = 0.0
+        for _, etype, *_payload in self.game.event_bus.drain():
+            if etype == EventType.KILL:
+                reward += self.KILL_REWARD
+            elif etype == EventType.LEAK:
+                reward += self.LEAK_PENALTY
+            elif etype == EventType.WAVE_END:
+                reward += self.WAVE_REWARD
+
+        terminated = self.finished()
+        truncated = not terminated and self.steps >= self.max_steps
+        return reward, terminated, truncated
+
+    def finished(self):
+        wm = self.game.wave_manager
+        return self.game.lives <= 0 or (wm.wave_index >= len(wm.waves) and not wm.wave_active)
+
+    def observe(self, out=None):
+        """Build the observation dict; with `out`, fill those arrays in place instead."""
+        if out is None:
+            out = self.empty_observation()
+        game = self.game
+        enemies = game.enemies
+        shown = enemies[:self.max_enemies]
+        out["enemies"][:] = 0.0
+        if shown:
+            out["enemies"][:len(shown)] = [(e["x"], e["y"], e["hp"]) for e in shown]
+        out["enemy_count"][...] = len(enemies)
+
+        out["tower_types"][:] = -1
+        out["tower_levels"][:] = 0
+        for spot_index, tower in game.tower_manager.towers_by_spot.items():
+            out["tower_types"][spot_index] = tower["typeId"]
+            out["tower_levels"][spot_index] = tower["level"]
+
+        out["gold"][...] = game.gold
+        out["lives"][...] = game.lives
+        out["wave"][...] = game.wave_manager.wave_index
+        return out
+
+    def empty_observation(self, batch=()):
+        spots = len(self.game.tower_spots)
+        return {
+            "enemies": np.zeros(batch + (self.max_enemies, 3), dtype=np.float32),
+            "enemy_count": np.zeros(batch, dtype=np.int32),
+            "tower_types": np.zeros(batch + (spots,), dtype=np.int32),
+            "tower_levels": np.zeros(batch + (spots,), dtype=np.int32),
+            "gold": np.zeros(batch, dtype=np.int32),
+            "lives": np.zeros(batch, dtype=np.int32),
+            "wave": np.zeros(batch, dtype=np.int32),
+        }
+
+class VectorTowerDefenseEnv:
+    """
+    N independent games stepped in lock-step in one process. Observations are
+    written straight into preallocated (N, ...) buffers, rewards/dones come
+    back as arrays, and finished games auto-reset (the final observation is in
+    info["final_observation"]).
+
+    All N games share one CombatEngine and one StatusEffectEngine, each game
+    seated under its env index, so the fighter and effect passes (most of a
+    tick) run once per frame across every env instead of once per game on a
+    handful of rows. Spawning, movement and towers stay per game. A game that
+    has finished mid-step, or is paused, gets a delta of 0 and sits the rest
+    of the step out, exactly like TowerDefenseEnv's early break.
+    """
+    def __init__(self, num_envs, seed=None, **kwargs):
+        self.num_envs = num_envs
+        self.combat = CombatEngine()
+        self.effects = StatusEffectEngine()
+        self.envs = [
+            TowerDefenseEnv(seed=None if seed is None else seed + i * 100003,
+                            combat=self.combat, effects=self.effects, batch_index=i, **kwargs)
+            for i in range(num_envs)
+        ]
+        self.num_actions = self.envs[0].num_actions
+        self.dt = self.envs[0].dt
+        self.frame_skip = self.envs[0].frame_skip
+        self.obs = self.envs[0].empty_observation((num_envs,))
+        self.rewards = np.zeros(num_envs, dtype=np.float32)
+        self.terminated = np.zeros(num_envs, dtype=bool)
+        self.truncated = np.zeros(num_envs, dtype=bool)
+        self.deltas = np.zeros(num_envs)
+
+    def view(self, i):
+        # Slice-and-reshape keeps even the per-env scalars as writable views
+        return {k: v[i:i + 1].reshape(v.shape[1:]) for k, v in self.obs.items()}
+
+    def reset(self):
+        for i, env in enumerate(self.envs):
+            env.reset()
+            env.observe(self.view(i))
+        return self.obs, {}
+
+    def tick(self, running):
+        """One frame of every running game, in Game.update's order."""
+        deltas = self.deltas
+        deltas[:] = 0.0
+        for i in running:
+            game = self.envs[i].game
+            if not game.paused:
+                deltas[i] = self.dt * game.gameSpeed
+                game.update_waves(deltas[i])
+        self.effects.step(deltas)
+        for i in running:
+            if deltas[i] > 0:
+                self.envs[i].game.update_field(deltas[i])
+        self.combat.step(deltas)
+
+    def step(self, actions):
+        for i, env in enumerate(self.envs):
+            env.act(actions[i])
+        running = list(range(self.num_envs))
+        for _ in range(self.frame_skip):
+            self.tick(running)
+            running = [i for i in running if not self.envs[i].finished()]
+            if not running:
+                break
+
+        final = {}
+        for i, env in enumerate(self.envs):
+            reward, term, trunc = env.settle()
+            self.rewards[i] = reward
+            self.terminated[i] = term
+            self.truncated[i] = trunc
+            if term or trunc:
+                final[i] = env.observe()
+                env.reset()
+            env.observe(self.view(i))
+        info = {"final_observation": final} if final else {}
+        return self.obs, self.rewards, self.terminated, self.truncated, info
@@ -1,74 +1,73 @@
 import math
 import pygame
 
+from tower_scheduler import TowerScheduler
+from tower_registry import TowerRegistry
+from event_bus import EventType
+
 class TowerManager:
     def __init__(self, game):
         self.game = game
         self.towers = []
+        self.towers_by_spot = {}  # spot index -> tower
         self.projectiles = []
-
-        self.tower_types = [
-            {
-                "type": "point",
-                "basePrice": 80,
-                "range": 169,
-                "splashRadius": 0,
-                "fireRate": 1.5,
-                "upgrades": [
-                    { "level": 1, "damage": 10, "upgradeCost": 0   },
-                    { "level": 2, "damage": 15, "upgradeCost": 50  },
-                    { "level": 3, "damage": 20, "upgradeCost": 100 },
-                    { "level": 4, "damage": 25, "upgradeCost": 150 },
-                ],
-            },
-            {
-                "type": "splash",
-                "basePrice": 80,
-                "range": 104,
-                "splashRadius": 50,
-                "fireRate": 1.5,
-                "upgrades": [
-                    { "level": 1, "damage": 8,  "upgradeCost": 0   },
-                    { "level": 2, "damage": 12, "upgradeCost": 50  },
-                    { "level": 3, "damage": 16, "upgradeCost": 100 },
-                    { "level": 4, "damage": 20, "upgradeCost": 150 },
-                ],
-            },
-        ]
+        self.next_tower_id = 0
+        self.next_projectile_id = 0
+        self.scheduler = TowerScheduler(game.enemy_grid)
+        self.registry = TowerRegistry()
 
     def get_tower_data(self):
-        return self.tower_types
+        return self.registry.definitions
+
+    def buy_tower(self, spot, type_id):
+        """Pay for and build a tower of `type_id` on an empty spot."""
+        cost = self.registry.base_price[type_id]
+        if self.game.gold < cost or spot["occupied"]:
+            return None
+        self.game.gold -= cost
+        spot["occupied"] = True
+        return self.create_tower(self.registry.type_names[type_id], spot["x"], spot["y"], spot)
 
     def create_tower(self, tower_type_name, x, y, spot):
-        definition = next((t for t in self.tower_types if t["type"] == tower_type_name), None)
-        if not definition:
+        type_id = self.registry.type_id(tower_type_name)
+        if type_id is None:
             return None
 
-        lvl_data = definition["upgrades"][0]
+        # Stats stay in the registry's tables; a tower is just type + level + placement
         tower = {
-            "type": definition["type"],
-            "level": lvl_data["level"],
-            "damage": lvl_data["damage"],
-            "range": definition["range"],
-            "splashRadius": definition["splashRadius"],
-            "fireRate": definition["fireRate"],
-            "fireCooldown": 0.0,
-            "upgradeCost": definition["upgrades"][1]["upgradeCost"] if len(definition["upgrades"]) > 1 else 0,
-            "maxLevel": len(definition["upgrades"]),
+            "id": self.next_tower_id,
+            "typeId": type_id,
+            "level": 1,
             "x": x,
             "y": y,
             "spot": spot,
         }
+        self.next_tower_id += 1
         self.towers.append(tower)
+        self.towers_by_spot[spot["index"]] = tower
+        self.game.event_bus.emit(
+            EventType.BUILD, tower["id"], tower_type_name, spot["index"], self.registry.base_price[type_id]
+        )
+        if self.registry.kind[type_id] == "barracks":
+            # Barracks don't shoot; their soldiers fight in the CombatEngine
+            self.game.unit_manager.create_barracks_units(tower)
+        else:
+            self.scheduler.add_tower(tower, self.registry.range[type_id])
         return tower
 
     def update(self, delta_sec):
-        for tower in self.towers:
-            tower["fireCooldown"] -= delta_sec
-            if tower["fireCooldown"] <= 0:
-                self.fire_tower(tower)
-                tower["fireCooldown"] = tower["fireRate"]
-
+        # Only towers whose cooldown expired (or that just saw an enemy walk
+        # into their range) come back from the scheduler.
+        due = self.scheduler.advance(delta_sec)
+        fire_rate = self.registry.fire_rate
+        for tower in due:
+            if self.fire_tower(tower):
+                self.scheduler.schedule(tower, fire_rate[tower["typeId"]])
+            else:
+                self.scheduler.sleep(tower)
+
+        damage_enemy = self.game.enemy_manager.damage_enemy
+        apply_effect = self.game.effects.apply
         to_remove = []
         for proj in self.projectiles:
             self.update_projectile(proj, delta_sec)
@@ -79,13 +78,17 @@ class TowerManager:
                         dy = enemy["y"] - proj["targetY"]
                         dist2 = dx*dx + dy*dy
                         if dist2 <= (proj["splashRadius"] ** 2):
-                            if enemy == proj["mainTarget"]:
-                                enemy["hp"] -= proj["damage"]
+                            if enemy is proj["mainTarget"]:
+                                damage_enemy(enemy, proj["damage"])
                             else:
-                                enemy["hp"] -= (proj["damage"] / 2.0)
+                                damage_enemy(enemy, proj["damage"] / 2.0)
+                            for effect in proj["effects"]:
+                                apply_effect(enemy, effect)
                 else:
-                    if proj["mainTarget"] in self.game.enemies:
-                        proj["mainTarget"]["hp"] -= proj["damage"]
+                    if not proj["mainTarget"]["dead"]:
+                        damage_enemy(proj["mainTarget"], proj["damage"])
+                        for effect in proj["effects"]:
+                            apply_effect(proj["mainTarget"], effect)
                 to_remove.append(proj)
 
         self.projectiles = [p for p in self.projectiles if p not in to_remove]
@@ -104,24 +107,23 @@ class TowerManager:
             proj["y"] += (dy / dist) * step
 
     def fire_tower(self, tower):
-        in_range_enemies = []
-        for enemy in self.game.enemies:
-            dx = enemy["x"] - tower["x"]
-            dy = enemy["y"] - tower["y"]
-            dist2 = dx*dx + dy*dy
-            if dist2 <= (tower["range"]*tower["range"]):
-                in_range_enemies.append(enemy)
-
+        """Shoot at the oldest enemy in range. Returns False if there was nothing to shoot."""
+        reg = self.registry
+        tid = tower["typeId"]
+        in_range_enemies = self.game.enemy_grid.query_radius(tower["x"], tower["y"], reg.range[tid])
         if not in_range_enemies:
-            return
+            return False
 
-        target = in_range_enemies[0]
+        # Oldest spawn first (same target the old full-list scan picked)
+        target = min(in_range_enemies, key=lambda e: e["id"])
         proj = {
+            "id": self.next_projectile_id,
             "x": tower["x"],
             "y": tower["y"],
             "speed": 300,
-            "damage": tower["damage"],
-            "splashRadius": tower["splashRadius"],
+            "damage": reg.damage[tid][tower["level"] - 1],
+            "splashRadius": reg.splash_radius[tid],
+            "effects": reg.effects[tid],
             "mainTarget": target,
             "targetX": target["x"],
             "targetY": target["y"],
@@ -129,41 +131,38 @@ class TowerManager:
             "w": 4,
             "h": 4
         }
+        self.next_projectile_id += 1
         self.projectiles.append(proj)
+        self.game.event_bus.emit(EventType.SHOT, tower["id"], target["id"], proj["damage"])
+        return True
 
     def upgrade_tower(self, tower):
-        definition = next((t for t in self.tower_types if t["type"] == tower["type"]), None)
-        if not definition:
-            return
-        if tower["level"] >= len(definition["upgrades"]):
+        tid = tower["typeId"]
+        if tower["level"] >= self.registry.max_level[tid]:
             return
 
-        next_lvl_index = tower["level"]
-        next_lvl_data = definition["upgrades"][next_lvl_index]
-        cost = next_lvl_data["upgradeCost"]
+        cost = self.registry.next_upgrade_cost(tid, tower["level"])
         if self.game.gold < cost:
             return
 
         self.game.gold -= cost
         tower["level"] += 1
-        tower["damage"] = next_lvl_data["damage"]
-        if tower["level"] < tower["maxLevel"]:
-            tower["upgradeCost"] = definition["upgrades"][tower["level"]]["upgradeCost"]
-        else:
-            tower["upgradeCost"] = 0
+        self.game.event_bus.emit(EventType.UPGRADE, tower["id"], tower["level"], cost)
+        if self.registry.kind[tid] == "barracks":
+            self.game.unit_manager.apply_level(tower)
 
     def draw_towers(self, screen):
         for tower in self.towers:
             rad = 12 + tower["level"] * 2
-            color = (0,0,255) if tower["type"] == "point" else (255,0,0)
+            color = self.registry.color[tower["typeId"]]
             pygame.draw.circle(screen, color, (tower["x"], tower["y"]), rad, 0)
             pygame.draw.circle(screen, (255,255,255), (tower["x"], tower["y"]), rad, 1)
 
-            if self.game.debug_mode:
+            if self.game.debug_mode and self.registry.range[tower["typeId"]] > 0:
                 pygame.draw.circle(
                     screen, (255,255,255),
                     (tower["x"], tower["y"]),
-                    tower["range"], 1
+                    self.registry.range[tower["typeId"]], 1
                 )
 
     def draw_projectiles(self, screen):
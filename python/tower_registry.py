@@ -0,0 +1,90 @@
+from types import MappingProxyType
+
+from data.tower_config import TOWER_DEFINITIONS
+from status_effects import StatusEffectEngine
+
+class TowerRegistry:
+    """
+    Indexed, read-only stat tables for every tower type.
+
+    Types are addressed by a small integer id (their registration order), and
+    per-level stats are tuples indexed by level - 1, so a tower only needs to
+    carry {"typeId", "level"} and every lookup is a plain index:
+
+        registry.damage[type_id][level - 1]
+    """
+    def __init__(self, definitions=TOWER_DEFINITIONS):
+        self.definitions = ()
+        self.type_ids = {}
+
+        # Per-type scalars (index = type id)
+        self.type_names = ()
+        self.base_price = ()
+        self.range = ()
+        self.splash_radius = ()
+        self.fire_rate = ()
+        self.max_level = ()
+        self.color = ()
+        self.kind = ()            # "projectile" or "barracks"
+        self.effects = ()         # status effects applied on hit
+
+        # Per-type, per-level tables (index = type id, then level - 1)
+        self.damage = ()
+        self.upgrade_cost = ()
+        self.soldier_hp = ()
+        self.soldier_damage = ()
+
+        for definition in definitions:
+            self.register(definition)
+
+    def register(self, definition):
+        """Add a tower type and return its id. Re-registering a name replaces it."""
+        # Checked here, once, so StatusEffectEngine.apply never has to on a hit
+        for effect in definition.get("effects", ()):
+            if effect["kind"] not in StatusEffectEngine.KINDS:
+                raise ValueError(f"tower '{definition['type']}' has unknown effect kind '{effect['kind']}'")
+        frozen = MappingProxyType({
+            **definition,
+            "upgrades": tuple(MappingProxyType(dict(u)) for u in definition["upgrades"]),
+            "effects": tuple(MappingProxyType(dict(e)) for e in definition.get("effects", ())),
+        })
+        name = frozen["type"]
+        defs = list(self.definitions)
+        if name in self.type_ids:
+            defs[self.type_ids[name]] = frozen
+        else:
+            defs.append(frozen)
+        self.definitions = tuple(defs)
+        self.build_tables()
+        return self.type_ids[name]
+
+    def build_tables(self):
+        defs = self.definitions
+        self.type_ids = {d["type"]: i for i, d in enumerate(defs)}
+        self.type_names = tuple(d["type"] for d in defs)
+        self.base_price = tuple(d["basePrice"] for d in defs)
+        self.range = tuple(d["range"] for d in defs)
+        self.splash_radius = tuple(d["splashRadius"] for d in defs)
+        self.fire_rate = tuple(d["fireRate"] for d in defs)
+        self.max_level = tuple(len(d["upgrades"]) for d in defs)
+        self.color = tuple(tuple(d.get("color", (255,0,0))) for d in defs)
+        self.kind = tuple(d.get("kind", "projectile") for d in defs)
+        self.effects = tuple(d["effects"] for d in defs)
+        self.damage = tuple(tuple(u.get("damage", 0) for u in d["upgrades"]) for d in defs)
+        self.soldier_hp = tuple(tuple(u.get("soldierHp", 0) for u in d["upgrades"]) for d in defs)
+        self.soldier_damage = tuple(tuple(u.get("soldierDmg", 0) for u in d["upgrades"]) for d in defs)
+        # upgrade_cost[t][i] is the price of going from level i to level i + 1
+        # (index 0 is the free base level, matching the data's "upgradeCost": 0)
+        self.upgrade_cost = tuple(tuple(u["upgradeCost"] for u in d["upgrades"]) for d in defs)
+
+    def __len__(self):
+        return len(self.definitions)
+
+    def type_id(self, name):
+        return self.type_ids.get(name)
+
+    def next_upgrade_cost(self, type_id, level):
+        """Cost to go from `level` to `level + 1`, or 0 at max level."""
+        if level >= self.max_level[type_id]:
+            return 0
+        return self.upgrade_cost[type_id][level]
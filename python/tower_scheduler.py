@@ -0,0 +1,83 @@
+import heapq
+
+class TowerScheduler:
+    """
+    Decides which towers need attention on a given tick.
+
+    - Towers on cooldown sit in a min-heap keyed by the time they can fire again.
+    - Towers that were ready but had nothing in range go to sleep and are
+      registered against every grid cell their range circle touches. When an
+      enemy occupies one of those cells it is checked against the range
+      circle itself, and the tower only wakes if the enemy is inside. A
+      woken tower therefore always has a target.
+
+    So a tick only costs work for towers that are actually due to fire.
+    """
+    def __init__(self, grid):
+        self.grid = grid
+        self.clock = 0.0
+        self.ready_heap = []      # (readyTime, seq, tower)
+        self.seq = 0              # tie-breaker so towers are never compared
+        self.sleeping = {}        # cell -> set of tower ids
+        self.sleeping_towers = {} # tower id -> tower
+        self.watch_cells = {}     # tower id -> list of cells
+        self.reach = {}           # tower id -> (x, y, range squared)
+
+    def add_tower(self, tower, tower_range):
+        self.watch_cells[tower["id"]] = self.grid.cells_in_radius(tower["x"], tower["y"], tower_range)
+        self.reach[tower["id"]] = (tower["x"], tower["y"], tower_range * tower_range)
+        self.schedule(tower, 0.0)
+
+    def schedule(self, tower, delay):
+        """Fire `tower` again once `delay` seconds have passed."""
+        heapq.heappush(self.ready_heap, (self.clock + delay, self.seq, tower))
+        self.seq += 1
+
+    def sleep(self, tower):
+        """Park a ready tower until an enemy comes within its range."""
+        tid = tower["id"]
+        self.sleeping_towers[tid] = tower
+        for cell in self.watch_cells[tid]:
+            self.sleeping.setdefault(cell, set()).add(tid)
+
+    def wake(self, tid):
+        tower = self.sleeping_towers.pop(tid)
+        for cell in self.watch_cells[tid]:
+            watchers = self.sleeping.get(cell)
+            if watchers is not None:
+                watchers.discard(tid)
+                if not watchers:
+                    del self.sleeping[cell]
+        self.schedule(tower, 0.0)
+
+    def advance(self, delta_sec):
+        """
+        Move the clock forward, wake sleepers with an enemy inside their range,
+        and return the towers that are due to fire this tick.
+        """
+        self.clock += delta_sec
+
+        if self.sleeping:
+            to_wake = set()
+            sleeping = self.sleeping
+            for cell, bucket in self.grid.cells.items():
+                watchers = sleeping.get(cell)
+                if not watchers:
+                    continue
+                for tid in watchers:
+                    if tid in to_wake:
+                        continue
+                    x, y, r2 = self.reach[tid]
+                    for enemy in bucket:
+                        dx = enemy["x"] - x
+                        dy = enemy["y"] - y
+                        if dx*dx + dy*dy <= r2:
+                            to_wake.add(tid)
+                            break
+            for tid in to_wake:
+                self.wake(tid)
+
+        due = []
+        while self.ready_heap and self.ready_heap[0][0] <= self.clock:
+            due.append(heapq.heappop(self.ready_heap)[2])
+        return due
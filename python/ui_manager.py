@@ -1,9 +1,18 @@
 import pygame
 
+import commands
+from fonts import get_font
+from hit_testing import HitTester
+
 class UIManager:
     def __init__(self, game):
         self.game = game
         self.selected_enemy = None
+        self.selected_hero = None
+
+        # Where game-changing actions go. None = apply to this game directly;
+        # a remote client swaps in a function that sends them to the server.
+        self.command_sink = None
 
         # We'll anchor the buttons from the right side of the window (which is 800 wide by default).
         # Each button has a width; we set x = self.game.width - (some offset).
@@ -34,12 +43,28 @@ class UIManager:
             "action": "speed"
         }
 
-        self.top_buttons = [speedBtn, pauseBtn, sendWaveBtn]
+        towerTypeBtn = {
+            "label": "POINT",
+            "x": self.game.width - 330,  # 800 - 330 = 470
+            "y": 10,
+            "w": 80,
+            "h": 24,
+            "action": "towerType"
+        }
+
+        self.top_buttons = [speedBtn, pauseBtn, sendWaveBtn, towerTypeBtn]
+
+        # Type id (in the tower registry) that a click on an empty spot builds
+        self.selected_tower_type = 0
+
+        # Bottom panel is anchored to the window bottom; positions are fixed so
+        # the buttons can be indexed once for hit-testing.
+        panel_y = self.game.height - 130
 
         self.debug_toggle_button = {
             "label": "Disable Debug", 
             "x": 10, 
-            "y": None, 
+            "y": panel_y, 
             "w": 120, 
             "h": 24, 
             "action": "debugToggle"
@@ -47,24 +72,24 @@ class UIManager:
 
         self.gold_minus_button = {
             "label": "-",   
-            "x": None, 
-            "y": None, 
+            "x": 120, 
+            "y": panel_y + 26, 
             "w": 24, 
             "h": 24, 
             "action": "goldMinus"
         }
         self.gold_plus_button = {
             "label": "+",   
-            "x": None, 
-            "y": None, 
+            "x": 180, 
+            "y": panel_y + 26, 
             "w": 24, 
             "h": 24, 
             "action": "goldPlus"
         }
         self.restart_button = {
             "label": "Restart", 
-            "x": None, 
-            "y": None, 
+            "x": 220, 
+            "y": panel_y + 26, 
             "w": 80, 
             "h": 24, 
             "action": "restart"
@@ -72,6 +97,14 @@ class UIManager:
 
         self.show_debug_table = True
 
+        self.hit_tester = HitTester(game)
+        self.hit_tester.rebuild_widgets(self.top_buttons + [
+            self.debug_toggle_button,
+            self.gold_minus_button,
+            self.gold_plus_button,
+            self.restart_button,
+        ])
+
     # ---------------------------------------
     # Drawing the top panel
     # ---------------------------------------
@@ -81,6 +114,7 @@ class UIManager:
         speedBtn = self.top_buttons[0]
         pauseBtn = self.top_buttons[1]
         sendBtn  = self.top_buttons[2]
+        typeBtn  = self.top_buttons[3]
 
         # Speed label
         speedBtn["label"] = f"{self.game.gameSpeed}x"
@@ -91,6 +125,10 @@ class UIManager:
         else:
             pauseBtn["label"] = "Pause" if not self.game.paused else "Resume"
 
+        # Tower type that will be built on an empty spot
+        registry = self.game.tower_manager.registry
+        typeBtn["label"] = registry.type_names[self.selected_tower_type].upper()
+
         # Just draw them
         for btn in self.top_buttons:
             self.draw_button(screen, btn)
@@ -99,11 +137,10 @@ class UIManager:
     # Drawing the bottom panel
     # ---------------------------------------
     def draw_bottom_panel(self, screen):
-        font = pygame.font.SysFont(None, 20)
+        font = get_font(20)
         panel_y = self.game.height - 130
 
         # Debug toggle
-        self.debug_toggle_button["y"] = panel_y
         self.draw_button(screen, self.debug_toggle_button)
 
         # "Starting gold" label
@@ -111,8 +148,6 @@ class UIManager:
         screen.blit(gold_lbl, (10, panel_y + 30))
 
         # Minus button
-        self.gold_minus_button["x"] = 120
-        self.gold_minus_button["y"] = panel_y + 26
         self.draw_button(screen, self.gold_minus_button)
 
         # Show current starting gold
@@ -121,13 +156,9 @@ class UIManager:
         screen.blit(gold_val_surf, (150, panel_y + 30))
 
         # Plus button
-        self.gold_plus_button["x"] = 180
-        self.gold_plus_button["y"] = panel_y + 26
         self.draw_button(screen, self.gold_plus_button)
 
         # Restart button
-        self.restart_button["x"] = 220
-        self.restart_button["y"] = panel_y + 26
         self.draw_button(screen, self.restart_button)
 
         # Debug table if enabled
@@ -137,9 +168,13 @@ class UIManager:
     def draw_enemy_stats(self, screen):
         if not self.selected_enemy:
             return
+        if self.selected_enemy["dead"]:
+            # Killed or leaked; its effect slot may already belong to someone else
+            self.selected_enemy = None
+            return
 
         enemy = self.selected_enemy
-        font = pygame.font.SysFont(None, 20)
+        font = get_font(20)
 
         panel_x = 10
         panel_y = self.game.height - 80
@@ -152,7 +187,8 @@ class UIManager:
 
         name_text = font.render(f"Name: {enemy['name']}", True, (255,255,255))
         hp_text   = font.render(f"HP: {int(enemy['hp'])}/{int(enemy['baseHp'])}", True, (255,255,255))
-        spd_text  = font.render(f"Speed: {int(enemy['speed'])}", True, (255,255,255))
+        speed = enemy['speed'] * self.game.effects.speed_mult[enemy['fxSlot']]
+        spd_text  = font.render(f"Speed: {int(speed)}", True, (255,255,255))
         gold_text = font.render(f"Gold on Kill: {enemy['gold']}", True, (255,255,255))
 
         screen.blit(name_text, (panel_x+10, panel_y+5))
@@ -161,81 +197,50 @@ class UIManager:
         screen.blit(gold_text, (panel_x+10, panel_y+55))
 
     def draw_debug_table(self, screen, y_start):
-        font = pygame.font.SysFont(None, 20)
-        towerData = self.game.tower_manager.get_tower_data()
-        if len(towerData) < 2:
-            return  # We only have 2 tower types in the example
+        font = get_font(20)
+        registry = self.game.tower_manager.registry
 
         row_x = 10
         row_y = y_start
 
-        # Title row
-        headers = f"Base Price       {towerData[0]['type'].upper()} Tower    {towerData[1]['type'].upper()} Tower"
-        txtSurf = font.render(headers, True, (255,255,255))
-        screen.blit(txtSurf, (row_x, row_y))
-        row_y += 20
-
-        # Base price row
-        basePriceRow = f"Base Price  ${towerData[0]['basePrice']}          ${towerData[1]['basePrice']}"
-        txtSurf = font.render(basePriceRow, True, (255,255,255))
-        screen.blit(txtSurf, (row_x, row_y))
-        row_y += 20
-
-        # Upgrades
-        maxUpgrades = max(len(towerData[0]["upgrades"]), len(towerData[1]["upgrades"]))
-        for i in range(maxUpgrades):
-            lvl = i + 1
-            # Damage row
-            leftDam  = towerData[0]["upgrades"][i]["damage"] if i < len(towerData[0]["upgrades"]) else "-"
-            rightDam = towerData[1]["upgrades"][i]["damage"] if i < len(towerData[1]["upgrades"]) else "-"
-            lineD = f"Level {lvl} Damage:     {leftDam}             {rightDam}"
-            txtSurf = font.render(lineD, True, (255,255,255))
+        # One row per tower type, so the table grows downward with the registry
+        # instead of needing a column per type.
+        for tid in range(len(registry)):
+            if registry.kind[tid] == "barracks":
+                damages = "/".join(f"{h}hp:{d}" for h, d in zip(registry.soldier_hp[tid], registry.soldier_damage[tid]))
+            else:
+                damages = "/".join(str(d) for d in registry.damage[tid])
+            costs = "/".join(f"${c}" for c in registry.upgrade_cost[tid][1:]) or "-"
+            line = (f"{registry.type_names[tid].upper()} Tower   Base ${registry.base_price[tid]}"
+                    f"   Damage {damages}   Upgrades {costs}")
+            color = (255,255,0) if tid == self.selected_tower_type else (255,255,255)
+            txtSurf = font.render(line, True, color)
             screen.blit(txtSurf, (row_x, row_y))
             row_y += 20
 
-            # Upgrade cost row
-            if lvl > 1:
-                leftCost  = towerData[0]["upgrades"][i]["upgradeCost"] if i < len(towerData[0]["upgrades"]) else "-"
-                rightCost = towerData[1]["upgrades"][i]["upgradeCost"] if i < len(towerData[1]["upgrades"]) else "-"
-                lineC = f"Level {lvl} Upgrade:   ${leftCost}             ${rightCost}"
-                txtSurf = font.render(lineC, True, (255,255,255))
-                screen.blit(txtSurf, (row_x, row_y))
-                row_y += 20
-
     # ---------------------------------------
     # Button-click handling
     # ---------------------------------------
     def handle_ui_click(self, mx, my):
-        # 1) Check top-row buttons
-        for btn in self.top_buttons:
-            if self.clicked_in_button(mx, my, btn):
-                self.handle_button_action(btn["action"])
-                return
-
-        # 2) Check bottom-row buttons
-        if self.clicked_in_button(mx, my, self.debug_toggle_button):
-            self.handle_button_action(self.debug_toggle_button["action"])
-            return
-        if self.clicked_in_button(mx, my, self.gold_minus_button):
-            self.handle_button_action(self.gold_minus_button["action"])
-            return
-        if self.clicked_in_button(mx, my, self.gold_plus_button):
-            self.handle_button_action(self.gold_plus_button["action"])
-            return
-        if self.clicked_in_button(mx, my, self.restart_button):
-            self.handle_button_action(self.restart_button["action"])
+        # 1) UI buttons (only the ones bucketed in the clicked cell are checked)
+        btn = self.hit_tester.widget_at(mx, my)
+        if btn:
+            self.handle_button_action(btn["action"])
             return
 
-        # 3) If none of the UI buttons were clicked, we check the game canvas
+        # 2) If none of the UI buttons were clicked, we check the game canvas
         self.handle_canvas_click(mx, my)
 
     def handle_button_action(self, action):
         if action == "speed":
-            self.game.toggle_speed()
+            self.dispatch(commands.SPEED)
         elif action == "pause":
-            self.game.toggle_pause()
+            self.dispatch(commands.PAUSE)
         elif action == "sendwave":
-            self.game.wave_manager.send_wave_early()
+            self.dispatch(commands.SEND_WAVE)
+        elif action == "towerType":
+            count = len(self.game.tower_manager.registry)
+            self.selected_tower_type = (self.selected_tower_type + 1) % count
         elif action == "debugToggle":
             self.show_debug_table = not self.show_debug_table
             if self.show_debug_table:
@@ -249,50 +254,44 @@ class UIManager:
         elif action == "goldPlus":
             self.game.startingGold += 100
         elif action == "restart":
-            self.game.resetGame(self.game.startingGold)
+            # A remote mirror can't restart the server's game
+            if self.command_sink is None:
+                self.game.resetGame(self.game.startingGold)
 
     def handle_canvas_click(self, mx, my):
+        # Heroes: click one to select it, then click the map to send it there
+        hero = self.game.hero_manager.get_hero_at(mx, my)
+        if hero:
+            self.selected_hero = hero
+            self.selected_enemy = None
+            return
+        if self.selected_hero:
+            hero_index = self.game.hero_manager.heroes.index(self.selected_hero)
+            self.dispatch(commands.MOVE_HERO, hero_index, int(mx), int(my))
+            self.selected_hero = None
+            return
+
         # Tower spots
-        for spot in self.game.tower_spots:
-            dx = mx - spot["x"]
-            dy = my - spot["y"]
-            if dx*dx + dy*dy <= 100:
-                existing_tower = None
-                for t in self.game.tower_manager.towers:
-                    if t["spot"] == spot:
-                        existing_tower = t
-                        break
-                if existing_tower:
-                    self.game.tower_manager.upgrade_tower(existing_tower)
-                else:
-                    tower_data = self.game.tower_manager.get_tower_data()[0]  # default "point" tower
-                    cost = tower_data["basePrice"]
-                    if self.game.gold >= cost and not spot["occupied"]:
-                        self.game.gold -= cost
-                        self.game.tower_manager.create_tower(
-                            tower_data["type"], 
-                            spot["x"], 
-                            spot["y"], 
-                            spot
-                        )
-                        spot["occupied"] = True
-                return
+        spot = self.hit_tester.spot_at(mx, my)
+        if spot:
+            if spot["index"] in self.game.tower_manager.towers_by_spot:
+                self.dispatch(commands.UPGRADE, spot["index"])
+            else:
+                self.dispatch(commands.PLACE, spot["index"], self.selected_tower_type)
+            return
 
         # Enemies
-        for enemy in self.game.enemies:
-            left   = enemy["x"] - enemy["width"]/2
-            right  = enemy["x"] + enemy["width"]/2
-            top    = enemy["y"] - enemy["height"]/2
-            bottom = enemy["y"] + enemy["height"]/2
-            if (mx >= left and mx <= right and my >= top and my <= bottom):
-                self.selected_enemy = enemy
-                return
-
-        self.selected_enemy = None
+        self.selected_enemy = self.hit_tester.enemy_at(mx, my)
 
     # ---------------------------------------
     # Helpers
     # ---------------------------------------
+    def dispatch(self, code, a=0, b=0, c=0):
+        if self.command_sink:
+            self.command_sink(code, a, b, c)
+        else:
+            commands.apply_command(self.game, code, a, b, c)
+
     def draw_button(self, screen, btn):
         """Draw a simple rect with label."""
         bx, by, bw, bh = btn["x"], btn["y"], btn["w"], btn["h"]
@@ -301,14 +300,7 @@ class UIManager:
 
         pygame.draw.rect(screen, (128,0,0), (bx, by, bw, bh), 0)  # fill
         pygame.draw.rect(screen, (200,0,0), (bx, by, bw, bh), 1)  # border
-        font = pygame.font.SysFont(None, 18)
+        font = get_font(18)
         label_surf = font.render(btn["label"], True, (255,255,255))
         text_rect = label_surf.get_rect(center=(bx + bw//2, by + bh//2))
         screen.blit(label_surf, text_rect)
-
-    def clicked_in_button(self, mx, my, btn):
-        bx, by, bw, bh = btn["x"], btn["y"], btn["w"], btn["h"]
-        if bx is None or by is None:
-            return False
-        return (mx >= bx and mx <= bx + bw and 
-                my >= by and my <= by + bh)
\ No newline at end of file
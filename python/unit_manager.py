@@ -0,0 +1,72 @@
+import pygame
+
+def nearest_point_on_path(path, x, y):
+    """Closest point to (x, y) on the polyline `path`."""
+    best = None
+    best_d2 = float("inf")
+    for (ax, ay), (bx, by) in zip(path, path[1:]):
+        abx, aby = bx - ax, by - ay
+        seg2 = abx*abx + aby*aby
+        t = 0.0 if seg2 == 0 else max(0.0, min(1.0, ((x - ax)*abx + (y - ay)*aby) / seg2))
+        px, py = ax + abx*t, ay + aby*t
+        d2 = (px - x)**2 + (py - y)**2
+        if d2 < best_d2:
+            best, best_d2 = (px, py), d2
+    return best if best is not None else (x, y)
+
+class UnitManager:
+    """
+    Barracks soldiers (the Python side of js/unitManager.js's TowerUnitGroup).
+    The soldiers themselves are fighter slots in the shared CombatEngine; this
+    just creates them, moves their rally point and draws them.
+    """
+    # Small triangle around the barracks so the squad doesn't overlap
+    SQUAD_OFFSETS = [(0, -10), (-12, 10), (12, 10)]
+
+    def __init__(self, game):
+        self.game = game
+        self.soldier_slots = []
+
+    def create_barracks_units(self, tower):
+        registry = self.game.tower_manager.registry
+        tid = tower["typeId"]
+        rx, ry = min(
+            (nearest_point_on_path(r.points, tower["x"], tower["y"]) for r in self.game.routes.routes),
+            key=lambda p: (p[0] - tower["x"])**2 + (p[1] - tower["y"])**2,
+            default=(tower["x"], tower["y"]),
+        )
+
+        tower["units"] = []
+        for dx, dy in self.SQUAD_OFFSETS:
+            slot = self.game.combat.add_fighter({
+                "x": tower["x"] + dx,
+                "y": tower["y"] + dy,
+                "rallyX": rx + dx,
+                "rallyY": ry + dy,
+                "maxHp": registry.soldier_hp[tid][0],
+                "damage": registry.soldier_damage[tid][0],
+                "engagementRange": 10,
+                "speed": 50,
+            }, self.game.batch_index)
+            tower["units"].append(slot)
+            self.soldier_slots.append(slot)
+
+    def apply_level(self, tower):
+        registry = self.game.tower_manager.registry
+        tid, lvl = tower["typeId"], tower["level"] - 1
+        self.game.combat.set_stats(tower["units"], registry.soldier_hp[tid][lvl], registry.soldier_damage[tid][lvl])
+
+    def draw(self, screen):
+        combat = self.game.combat
+        radius = 7
+        for slot in self.soldier_slots:
+            x, y = int(combat.x[slot]), int(combat.y[slot])
+            color = (128,128,128) if combat.dead[slot] else (139,69,19)
+            pygame.draw.circle(screen, color, (x, y), radius)
+
+            hp, max_hp = combat.hp[slot], combat.max_hp[slot]
+            if not combat.dead[slot] and hp < max_hp:
+                bar_w = 20
+                pct = hp / max_hp
+                pygame.draw.rect(screen, (255,0,0), (x - bar_w/2, y - radius - 6, bar_w, 3))
+                pygame.draw.rect(screen, (0,255,0), (x - bar_w/2, y - radius - 6, bar_w * pct, 3))
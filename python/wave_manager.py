@@ -1,3 +1,5 @@
+from event_bus import EventType
+
 class WaveManager:
     def __init__(self, game):
         self.game = game
@@ -8,7 +10,7 @@ class WaveManager:
 
     def load_waves_from_level(self, levelData):
         self.waves = levelData.get("waves", [])
-        print("Waves loaded:", self.waves)
+        self.game.event_bus.emit(EventType.LEVEL_LOADED, len(self.waves))
 
     def update(self, delta_sec):
         # If wave not active, see if there's another wave to start
@@ -31,7 +33,8 @@ class WaveManager:
                         group["timerAcc"] -= group["spawnIntervalSec"]
                         self.game.enemy_manager.spawn_enemy(
                             group["type"],
-                            group["hpMultiplier"]
+                            group["hpMultiplier"],
+                            group.get("route")
                         )
                         group["spawnedCount"] = group.get("spawnedCount", 0) + 1
 
@@ -43,12 +46,14 @@ class WaveManager:
                     break
 
             if all_spawned and len(self.game.enemies) == 0:
+                self.game.event_bus.emit(EventType.WAVE_END, self.wave_index)
                 self.wave_active = False
                 self.wave_index += 1
                 self.time_until_next_wave = 0
 
     def start_wave(self, index):
         self.wave_active = True
+        self.game.event_bus.emit(EventType.WAVE_START, index)
         wave_info = self.waves[index]
         for group in wave_info["enemyGroups"]:
             group["spawnedCount"] = 0